@@ -40,6 +40,7 @@ UI_STATE_FILE: Final[Path] = CONFIG_DIR / 'ui_state.json'
 CONFIG_FILE: Final[Path] = CONFIG_DIR / 'config.json'
 CUSTOM_SCRIPTS_FILE: Final[Path] = CONFIG_DIR / 'custom_scripts.json'
 SCRIPT_CACHE_DIR: Final[Path] = CONFIG_DIR / 'script_cache'
+PACKAGE_CHECK_CACHE_FILE: Final[Path] = CONFIG_DIR / 'package_check.json'
 
 # ============================================================================
 # UI DIMENSIONS & STYLING
@@ -86,7 +87,7 @@ TERMINAL_BG: Final[str] = "#1E1E1E"
 # TREEVIEW COLUMN INDICES (Critical for avoiding index bugs!)
 # ============================================================================
 
-# Main script tabs column structure (7 columns)
+# Main script tabs column structure (8 columns)
 COL_ICON: Final[int] = 0          # Cache status icon (✓/☁️)
 COL_NAME: Final[int] = 1          # Display name
 COL_PATH: Final[int] = 2          # Script path
@@ -94,6 +95,7 @@ COL_DESCRIPTION: Final[int] = 3   # Description text
 COL_IS_CUSTOM: Final[int] = 4     # Custom script flag (bool)
 COL_METADATA: Final[int] = 5      # Metadata JSON string
 COL_SCRIPT_ID: Final[int] = 6     # Script ID
+COL_SEARCH_KEY: Final[int] = 7    # Case-folded "name\0path" search key (hidden)
 
 # Repository tab column structure (5 columns)
 REPO_COL_SELECTED: Final[int] = 0     # Checkbox selection
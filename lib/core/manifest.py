@@ -446,7 +446,33 @@ class ManifestLoader:
 # MANIFEST CACHE REFRESH
 # ============================================================================
 
-def refresh_manifest_cache(manifest_url=None, terminal_callback=None):
+def _load_manifest_validators(etag_file: Path) -> Dict[str, str]:
+    """Load persisted ETag/Last-Modified headers for the cached manifest"""
+    try:
+        with open(etag_file, 'r') as f:
+            validators = json.load(f)
+        return validators if isinstance(validators, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest_validators(etag_file: Path, headers) -> None:
+    """Persist ETag/Last-Modified response headers for the next conditional request"""
+    validators = {
+        'etag': headers.get('ETag', ''),
+        'last_modified': headers.get('Last-Modified', '')
+    }
+    try:
+        if validators['etag'] or validators['last_modified']:
+            with open(etag_file, 'w') as f:
+                json.dump(validators, f)
+        elif etag_file.exists():
+            etag_file.unlink()
+    except OSError:
+        pass
+
+
+def refresh_manifest_cache(manifest_url=None, terminal_callback=None, conditional=False):
     """
     Clear and refresh all cached manifests (public + custom online repos).
     Downloads fresh copies from their configured URLs.
@@ -454,6 +480,8 @@ def refresh_manifest_cache(manifest_url=None, terminal_callback=None):
     Args:
         manifest_url: Optional single URL to refresh (if None, refreshes all active manifests)
         terminal_callback: Optional callback function(message) for terminal output
+        conditional: When refreshing a single URL, send If-None-Match/If-Modified-Since
+                     and keep the existing cache on a 304 Not Modified response
         
     Returns:
         True if successful, False otherwise
@@ -474,25 +502,37 @@ def refresh_manifest_cache(manifest_url=None, terminal_callback=None):
         # If specific URL provided, refresh only that one
         if manifest_url:
             cache_file = Path(C.MANIFEST_CACHE_FILE if C else (cache_dir / 'manifest.json'))
+            etag_file: Path = cache_file.with_suffix('.etag')
             
-            if cache_file.exists():
-                cache_file.unlink()
-                output("[+] Removed cached manifest")
+            headers = {}
+            if conditional and cache_file.exists():
+                validators = _load_manifest_validators(etag_file)
+                if validators.get('etag'):
+                    headers['If-None-Match'] = validators['etag']
+                if validators.get('last_modified'):
+                    headers['If-Modified-Since'] = validators['last_modified']
             
             output(f"[*] Downloading fresh manifest from {manifest_url}...")
             
-            result: CompletedProcess[bytes] = subprocess.run(
-                ['curl', '-sSfL', '-o', str(cache_file), manifest_url],
-                capture_output=True,
-                timeout=30
-            )
-            
-            if result.returncode == 0:
-                output("[+] Manifest downloaded successfully")
-                return True
-            else:
-                output("[!] Failed to download manifest")
+            try:
+                request = urllib.request.Request(manifest_url, headers=headers)
+                with urlopen(request, timeout=30) as response:
+                    manifest_content: bytes = response.read()
+                    response_headers = response.headers
+            except urllib.error.HTTPError as e:
+                if e.code == 304:
+                    output("[+] Manifest not modified - keeping cached copy")
+                    return True
+                output(f"[!] Failed to download manifest: HTTP {e.code}")
                 return False
+            except (urllib.error.URLError, OSError) as e:
+                output(f"[!] Failed to download manifest: {e}")
+                return False
+            
+            cache_file.write_bytes(manifest_content)
+            _save_manifest_validators(etag_file, response_headers)
+            output("[+] Manifest downloaded successfully")
+            return True
         
         # Otherwise refresh all cached manifests (public + custom online repos)
         output("[*] Clearing all cached manifests...")
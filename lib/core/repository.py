@@ -443,6 +443,21 @@ class ScriptRepository:
             # Default format: flat array
             return scripts_data
     
+    @staticmethod
+    def _read_manifest_source(manifest_path) -> dict:
+        """Return manifest data for a custom manifest given as a file path or an already-parsed dict."""
+        if isinstance(manifest_path, dict):
+            return manifest_path
+        with open(manifest_path, 'r') as f:
+            return json.load(f)
+    
+    @staticmethod
+    def _describe_manifest_source(manifest_path) -> str:
+        """Short label for a manifest source in log messages."""
+        if isinstance(manifest_path, dict):
+            return f"in-memory manifest '{manifest_path.get('name', 'custom')}'"
+        return str(manifest_path)
+    
     def get_script_by_id(self, script_id: str, manifest_path: Optional[Path] = None) -> Optional[dict]:
         """Get script information by ID.
         
@@ -451,7 +466,8 @@ class ScriptRepository:
         
         Args:
             script_id: Script ID to find (e.g., 'chrome', 'docker', 'zeroiter_tools')
-            manifest_path: Optional path to specific manifest file (for custom manifests)
+            manifest_path: Optional path to specific manifest file (for custom manifests),
+                or the parsed manifest dict itself
             
         Returns:
             Optional[dict]: Script metadata dict if found, None otherwise
@@ -459,23 +475,23 @@ class ScriptRepository:
         if manifest_path:
             # Load from specific custom manifest
             try:
-                with open(manifest_path, 'r') as f:
-                    manifest = json.load(f)
-                    scripts_data = manifest.get('scripts', [])
-                    # Handle both formats
-                    if isinstance(scripts_data, dict):
-                        all_scripts = []
-                        for category, category_scripts in scripts_data.items():
-                            for script in category_scripts:
-                                script['category'] = category
-                                all_scripts.append(script)
-                        scripts_data = all_scripts
-                    
-                    for script in scripts_data:
-                        if script.get('id') == script_id:
-                            return script
+                manifest = self._read_manifest_source(manifest_path)
+                scripts_data = manifest.get('scripts', [])
+                # Handle both formats
+                if isinstance(scripts_data, dict):
+                    # Copy each entry: a dict source may be the caller's cached
+                    # manifest, which must not pick up a 'category' key
+                    all_scripts = []
+                    for category, category_scripts in scripts_data.items():
+                        for script in category_scripts:
+                            all_scripts.append(dict(script, category=category))
+                    scripts_data = all_scripts
+                
+                for script in scripts_data:
+                    if script.get('id') == script_id:
+                        return script
             except Exception as e:
-                logging.error(f"Failed to load manifest from {manifest_path}: {e}")
+                logging.error(f"Failed to load manifest from {self._describe_manifest_source(manifest_path)}: {e}")
                 return None
         else:
             # First search custom manifests from config
@@ -662,12 +678,13 @@ class ScriptRepository:
         
         Args:
             script_id: Script ID to download
-            manifest_path: Optional path to specific manifest file (for custom manifests)
+            manifest_path: Optional path to specific manifest file (for custom manifests),
+                or the parsed manifest dict itself
         
         Returns:
             tuple: (success: bool, download_url: str)
         """
-        logging.info(f"Downloading script: {script_id}" + (f" from {manifest_path}" if manifest_path else ""))
+        logging.info(f"Downloading script: {script_id}" + (f" from {self._describe_manifest_source(manifest_path)}" if manifest_path else ""))
         
         script = self.get_script_by_id(script_id, manifest_path=manifest_path)
         if not script:
@@ -678,12 +695,11 @@ class ScriptRepository:
         if manifest_path:
             # Custom repository - download its includes
             try:
-                with open(manifest_path, 'r') as f:
-                    custom_manifest = json.load(f)
-                    custom_repo_url = custom_manifest.get('repository_url')
-                    if custom_repo_url:
-                        logging.info(f"Ensuring includes available for custom repository: {custom_repo_url}")
-                        self._download_repository_includes(custom_repo_url)
+                custom_manifest = self._read_manifest_source(manifest_path)
+                custom_repo_url = custom_manifest.get('repository_url')
+                if custom_repo_url:
+                    logging.info(f"Ensuring includes available for custom repository: {custom_repo_url}")
+                    self._download_repository_includes(custom_repo_url)
             except Exception as e:
                 logging.warning(f"Failed to ensure includes for custom repository: {e}")
         else:
@@ -709,8 +725,7 @@ class ScriptRepository:
         if local_script_path and local_script_path.exists():
             try:
                 logging.info(f"Using local repository file: {local_script_path}")
-                with open(local_script_path, 'rb') as f:
-                    content: bytes = f.read()
+                content: bytes = Path(local_script_path).read_bytes()
                 
                 # Save to cache
                 dest_path.parent.mkdir(parents=True, exist_ok=True)
@@ -739,8 +754,7 @@ class ScriptRepository:
                     logging.error(f"Local file not found: {local_file}")
                     return False, None, "Local file not found"
                 
-                with open(local_file, 'rb') as f:
-                    content: bytes = f.read()
+                content: bytes = Path(local_file).read_bytes()
             else:
                 # Download script from remote URL
                 logging.info(f"Downloading from remote: {download_url}")
@@ -752,10 +766,9 @@ class ScriptRepository:
             if manifest_path:
                 # Load from specific custom manifest
                 try:
-                    with open(manifest_path, 'r') as f:
-                        manifest = json.load(f)
+                    manifest = self._read_manifest_source(manifest_path)
                 except Exception as e:
-                    logging.warning(f"Failed to load manifest from {manifest_path}: {e}")
+                    logging.warning(f"Failed to load manifest from {self._describe_manifest_source(manifest_path)}: {e}")
                     manifest = None
             else:
                 # Load default/public manifest
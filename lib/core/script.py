@@ -48,15 +48,15 @@ class ScriptMetadata:
         
         # Check if this is a custom script from CustomScriptManager (user-added scripts)
         if custom_script_manager:
-            for custom_script in custom_script_manager.list_scripts():
-                if custom_script['path'] == script_path:
-                    metadata["type"] = "local"
-                    metadata["source_type"] = C.SOURCE_TYPE_CUSTOM_SCRIPT if C else "custom_script"
-                    metadata["source_name"] = "Custom Script"
-                    metadata["file_exists"] = os.path.exists(script_path)
-                    metadata["is_custom"] = True
-                    metadata["script_id"] = custom_script.get('id', '')
-                    return metadata
+            custom_script = custom_script_manager.get_script_by_path(script_path)
+            if custom_script is not None:
+                metadata["type"] = "local"
+                metadata["source_type"] = C.SOURCE_TYPE_CUSTOM_SCRIPT if C else "custom_script"
+                metadata["source_name"] = "Custom Script"
+                metadata["file_exists"] = os.path.exists(script_path)
+                metadata["is_custom"] = True
+                metadata["script_id"] = custom_script.get('id', '')
+                return metadata
         
         # Determine source from script_id_map or script_name tag
         source_type, source_name = ScriptMetadata._determine_source(
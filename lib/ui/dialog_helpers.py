@@ -13,6 +13,11 @@ from typing import Optional, List, Callable
 # DIALOG HELPERS
 # ============================================================================
 
+def present_and_forget(dialog: Gtk.Dialog) -> None:
+    """Show a dialog and destroy it on response, without a nested main loop"""
+    dialog.connect("response", lambda d, _response: d.destroy())
+    dialog.show()
+
 def show_error_dialog(parent_window: Optional[Gtk.Window], message: str, title: str = "Error") -> None:
     """Show a generic error dialog"""
     dialog = Gtk.MessageDialog(
@@ -37,8 +42,7 @@ def show_info_dialog(parent_window: Optional[Gtk.Window], message: str, title: s
         text=title
     )
     dialog.format_secondary_text(message)
-    dialog.run()
-    dialog.destroy()
+    present_and_forget(dialog)
 
 
 def show_warning_dialog(parent_window: Optional[Gtk.Window], message: str, title: str = "Warning") -> None:
@@ -51,8 +55,7 @@ def show_warning_dialog(parent_window: Optional[Gtk.Window], message: str, title
         text=title
     )
     dialog.format_secondary_text(message)
-    dialog.run()
-    dialog.destroy()
+    present_and_forget(dialog)
 
 
 def show_confirmation_dialog(
@@ -152,8 +155,7 @@ def show_install_started_dialog(
         message += "You can continue using the application."
     
     dialog.format_secondary_text(message)
-    dialog.run()
-    dialog.destroy()
+    present_and_forget(dialog)
 
 
 def show_install_completion_dialog(parent_window: Optional[Gtk.Window]) -> None:
@@ -169,8 +171,7 @@ def show_install_completion_dialog(parent_window: Optional[Gtk.Window]) -> None:
         "Package installation completed successfully.\n"
         "Check the terminal for details."
     )
-    dialog.run()
-    dialog.destroy()
+    present_and_forget(dialog)
 
 
 def show_download_confirmation_dialog(
@@ -9,10 +9,43 @@ import shlex
 import stat
 from pathlib import Path
 from gi.repository import Gtk, GLib
+from lib.ui.ui_components import TreeViewFactory
 
 # Debug flag
 DEBUG_CACHE = os.environ.get("LV_DEBUG_CACHE") == "1"
 
+# Ollama install guide text, encoded once and fed to the terminal in one write
+_RULE_80 = b"=" * 80
+_OLLAMA_INSTALL_INTRO = b"".join([
+    b"\r\n\x1b[36m", _RULE_80, b"\x1b[0m\r\n",
+    b"\x1b[36m  Install Ollama AI Engine\x1b[0m\r\n",
+    b"\x1b[36m", _RULE_80, b"\x1b[0m\r\n\r\n",
+    b"\x1b[32mOllama provides local AI-powered script analysis:\x1b[0m\r\n",
+    "  • Automatic script categorization\r\n".encode(),
+    "  • AI-generated descriptions\r\n".encode(),
+    "  • Dependency detection\r\n".encode(),
+    "  • Security analysis\r\n\r\n".encode(),
+    b"\x1b[33m[*] Installing Ollama...\x1b[0m\r\n",
+    b"curl https://ollama.ai/install.sh | sh\n",
+])
+_OLLAMA_NEXT_STEPS = b"".join([
+    b"\r\n\x1b[32m", _RULE_80, b"\x1b[0m\r\n",
+    b"\x1b[32m  Ollama Installation Next Steps\x1b[0m\r\n",
+    b"\x1b[32m", _RULE_80, b"\x1b[0m\r\n\r\n",
+    b"After installation completes:\r\n\r\n",
+    b"\x1b[33m1. Pull an AI model:\x1b[0m\r\n",
+    b"   ollama pull llama3.2  (recommended, ~2GB)\r\n",
+    b"   Or: ollama pull codellama  (code-focused, ~4GB)\r\n\r\n",
+    b"\x1b[33m2. Test the installation:\x1b[0m\r\n",
+    b"   ollama list\r\n\r\n",
+    b"\x1b[33m3. Restart this application\x1b[0m to enable AI features\r\n\r\n",
+    b"Visit https://ollama.ai for more information\r\n",
+])
+
+
+# Column indices of a full store row, for ListStore.insert_with_valuesv()
+_LOCAL_REPO_ROW_COLUMNS = list(range(8))
+
 
 class LocalRepositoryTabHandler:
     """Handles local repository tab creation and operations"""
@@ -34,13 +67,6 @@ class LocalRepositoryTabHandler:
         vbox.set_margin_top(10)
         vbox.set_margin_bottom(10)
         
-        # Check Ollama availability
-        try:
-            from lib.utilities.ai_categorizer import check_ollama_available
-            self.ollama_available = check_ollama_available()
-        except ImportError:
-            self.ollama_available = False
-        
         # Control buttons at the top
         button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
         
@@ -59,12 +85,12 @@ class LocalRepositoryTabHandler:
         delete_btn.connect("clicked", self._on_delete_selected)
         button_box.pack_start(delete_btn, False, False, 0)
         
-        # AI Analyze button
-        if self.ollama_available:
-            analyze_btn = Gtk.Button(label="AI Analyze Selected")
-            analyze_btn.get_style_context().add_class("suggested-action")
-            analyze_btn.connect("clicked", self._on_ai_analyze_scripts)
-            button_box.pack_start(analyze_btn, False, False, 0)
+        # AI Analyze button - hidden until the Ollama probe reports back
+        self.analyze_btn = Gtk.Button(label="AI Analyze Selected")
+        self.analyze_btn.get_style_context().add_class("suggested-action")
+        self.analyze_btn.connect("clicked", self._on_ai_analyze_scripts)
+        self.analyze_btn.set_no_show_all(True)
+        button_box.pack_start(self.analyze_btn, False, False, 0)
         
         # Refresh operations
         refresh_btn = Gtk.Button(label="Refresh List")
@@ -73,33 +99,12 @@ class LocalRepositoryTabHandler:
         
         vbox.pack_start(button_box, False, False, 0)
         
-        # AI Analysis banner
-        ai_banner = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        ai_banner.set_margin_bottom(5)
-        ai_banner.set_margin_top(5)
-        
-        if self.ollama_available:
-            ai_icon = Gtk.Label(label="🤖")
-            ai_banner.pack_start(ai_icon, False, False, 0)
-            
-            ai_label = Gtk.Label()
-            ai_label.set_markup("<span color='#2ecc71'><b>AI Analysis Available:</b> Ollama is ready for script categorization</span>")
-            ai_label.set_xalign(0)
-            ai_banner.pack_start(ai_label, True, True, 0)
-        else:
-            ai_icon = Gtk.Label(label="⚠️")
-            ai_banner.pack_start(ai_icon, False, False, 0)
-            
-            ai_label = Gtk.Label()
-            ai_label.set_markup("<span color='#e67e22'><b>AI Analysis Unavailable:</b> Install Ollama for automatic script categorization</span>")
-            ai_label.set_xalign(0)
-            ai_banner.pack_start(ai_label, True, True, 0)
-            
-            install_ollama_btn = Gtk.Button(label="📥 Install Ollama")
-            install_ollama_btn.connect("clicked", self._on_install_ollama)
-            ai_banner.pack_end(install_ollama_btn, False, False, 0)
-        
-        vbox.pack_start(ai_banner, False, False, 0)
+        # AI Analysis banner - filled in once the Ollama probe completes
+        self.ai_banner = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+        self.ai_banner.set_margin_bottom(5)
+        self.ai_banner.set_margin_top(5)
+        vbox.pack_start(self.ai_banner, False, False, 0)
+        self._start_ollama_probe()
         
         # Scripts list
         scrolled = Gtk.ScrolledWindow()
@@ -162,6 +167,9 @@ class LocalRepositoryTabHandler:
         size_column.set_min_width(60)
         self.local_repo_tree.append_column(size_column)
         
+        # Single-line rows: measure one row instead of every row on relayout
+        TreeViewFactory.use_fixed_row_height(self.local_repo_tree, expand_column=name_column)
+        
         scrolled.add(self.local_repo_tree)
         vbox.pack_start(scrolled, True, True, 0)
         
@@ -183,6 +191,16 @@ class LocalRepositoryTabHandler:
         if not self.repository:
             return
         
+        # Detach the view while rows go in, so the tree does not lay out
+        # and redraw after every insert; the filter is re-attached once
+        self.local_repo_tree.set_model(None)
+        try:
+            self._fill_store()
+        finally:
+            self.local_repo_tree.set_model(self.local_repo_filter)
+    
+    def _fill_store(self):
+        """Fill the local repository store (view detached by populate_tree)"""
         self.local_repo_store.clear()
         
         try:
@@ -375,7 +393,7 @@ class LocalRepositoryTabHandler:
                     size_text = "-"
                 
                 # Add to store
-                self.local_repo_store.append([
+                self.local_repo_store.insert_with_valuesv(-1, _LOCAL_REPO_ROW_COLUMNS, [
                     False,
                     script_id,
                     name,
@@ -564,35 +582,63 @@ class LocalRepositoryTabHandler:
         except Exception as e:
             self.parent.terminal.feed(f"\x1b[31m[!] Error executing script: {e}\x1b[0m\r\n".encode())
     
+    def _start_ollama_probe(self):
+        """Check Ollama availability in a background thread
+
+        ``ollama list`` can take seconds to answer, so the tab is built
+        without waiting and the banner is filled in via GLib.idle_add.
+        """
+        import threading
+
+        def probe():
+            try:
+                from lib.utilities.ai_categorizer import check_ollama_available
+                available = check_ollama_available()
+            except ImportError:
+                available = False
+            GLib.idle_add(self._apply_ollama_status, available)
+
+        threading.Thread(target=probe, daemon=True).start()
+
+    def _apply_ollama_status(self, available):
+        """Show the AI button and banner for the probed Ollama state"""
+        self.ollama_available = available
+        self.analyze_btn.set_visible(available)
+
+        if available:
+            ai_icon = Gtk.Label(label="🤖")
+            self.ai_banner.pack_start(ai_icon, False, False, 0)
+            
+            ai_label = Gtk.Label()
+            ai_label.set_markup("<span color='#2ecc71'><b>AI Analysis Available:</b> Ollama is ready for script categorization</span>")
+            ai_label.set_xalign(0)
+            self.ai_banner.pack_start(ai_label, True, True, 0)
+        else:
+            ai_icon = Gtk.Label(label="⚠️")
+            self.ai_banner.pack_start(ai_icon, False, False, 0)
+            
+            ai_label = Gtk.Label()
+            ai_label.set_markup("<span color='#e67e22'><b>AI Analysis Unavailable:</b> Install Ollama for automatic script categorization</span>")
+            ai_label.set_xalign(0)
+            self.ai_banner.pack_start(ai_label, True, True, 0)
+            
+            install_ollama_btn = Gtk.Button(label="📥 Install Ollama")
+            install_ollama_btn.connect("clicked", self._on_install_ollama)
+            self.ai_banner.pack_end(install_ollama_btn, False, False, 0)
+
+        self.ai_banner.show_all()
+        return False
+    
     def _on_install_ollama(self, button):
         """Guide user through Ollama installation"""
-        self.parent.terminal.feed(b"\r\n\x1b[36m" + b"="*80 + b"\x1b[0m\r\n")
-        self.parent.terminal.feed(b"\x1b[36m  Install Ollama AI Engine\x1b[0m\r\n")
-        self.parent.terminal.feed(b"\x1b[36m" + b"="*80 + b"\x1b[0m\r\n\r\n")
-        self.parent.terminal.feed(b"\x1b[32mOllama provides local AI-powered script analysis:\x1b[0m\r\n")
-        self.parent.terminal.feed("  • Automatic script categorization\r\n".encode())
-        self.parent.terminal.feed("  • AI-generated descriptions\r\n".encode())
-        self.parent.terminal.feed("  • Dependency detection\r\n".encode())
-        self.parent.terminal.feed("  • Security analysis\r\n\r\n".encode())
-        self.parent.terminal.feed(b"\x1b[33m[*] Installing Ollama...\x1b[0m\r\n")
-        self.parent.terminal.feed(b"curl https://ollama.ai/install.sh | sh\n")
+        self.parent.terminal.feed(_OLLAMA_INSTALL_INTRO)
         self.parent.terminal.feed_child(b"curl https://ollama.ai/install.sh | sh\n")
         
         GLib.timeout_add(3000, self._show_ollama_next_steps)
     
     def _show_ollama_next_steps(self):
         """Show Ollama post-installation steps"""
-        self.parent.terminal.feed(b"\r\n\x1b[32m" + b"="*80 + b"\x1b[0m\r\n")
-        self.parent.terminal.feed(b"\x1b[32m  Ollama Installation Next Steps\x1b[0m\r\n")
-        self.parent.terminal.feed(b"\x1b[32m" + b"="*80 + b"\x1b[0m\r\n\r\n")
-        self.parent.terminal.feed(b"After installation completes:\r\n\r\n")
-        self.parent.terminal.feed(b"\x1b[33m1. Pull an AI model:\x1b[0m\r\n")
-        self.parent.terminal.feed(b"   ollama pull llama3.2  (recommended, ~2GB)\r\n")
-        self.parent.terminal.feed(b"   Or: ollama pull codellama  (code-focused, ~4GB)\r\n\r\n")
-        self.parent.terminal.feed(b"\x1b[33m2. Test the installation:\x1b[0m\r\n")
-        self.parent.terminal.feed(b"   ollama list\r\n\r\n")
-        self.parent.terminal.feed(b"\x1b[33m3. Restart this application\x1b[0m to enable AI features\r\n\r\n")
-        self.parent.terminal.feed(b"Visit https://ollama.ai for more information\r\n")
+        self.parent.terminal.feed(_OLLAMA_NEXT_STEPS)
         GLib.timeout_add(100, self.parent._complete_terminal_silent)
         return False
     
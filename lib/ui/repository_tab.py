@@ -9,10 +9,14 @@ import shlex
 import hashlib
 from pathlib import Path
 from gi.repository import Gtk, GLib
+from lib.ui.ui_components import TreeViewFactory
 
 # Debug flag
 DEBUG_CACHE = os.environ.get("LV_DEBUG_CACHE") == "1"
 
+# Column indices of a full store row, for ListStore.insert_with_valuesv()
+_REPO_ROW_COLUMNS = list(range(9))
+
 
 class RepositoryTabHandler:
     """Handles repository tab creation and operations"""
@@ -141,6 +145,9 @@ class RepositoryTabHandler:
         modified_column.set_min_width(100)
         self.repo_tree.append_column(modified_column)
         
+        # Single-line rows: measure one row instead of every row on relayout
+        TreeViewFactory.use_fixed_row_height(self.repo_tree, expand_column=name_column)
+        
         scrolled.add(self.repo_tree)
         vbox.pack_start(scrolled, True, True, 0)
         
@@ -159,6 +166,16 @@ class RepositoryTabHandler:
         if not self.repository:
             return
         
+        # Detach the view while rows go in, so the tree does not lay out
+        # and redraw after every insert; the filter is re-attached once
+        self.repo_tree.set_model(None)
+        try:
+            self._fill_store()
+        finally:
+            self.repo_tree.set_model(self.repo_filter)
+    
+    def _fill_store(self):
+        """Fill the repository store (view detached by populate_tree)"""
         self.repo_store.clear()
         
         try:
@@ -343,8 +360,7 @@ class RepositoryTabHandler:
                     remote_checksum = script.get('checksum', '').replace('sha256:', '')
                     if remote_checksum and manifest_has_verification:
                         try:
-                            with open(cached_path, 'rb') as f:
-                                local_checksum = hashlib.sha256(f.read()).hexdigest()
+                            local_checksum = hashlib.sha256(Path(cached_path).read_bytes()).hexdigest()
                             if local_checksum == remote_checksum:
                                 status_text = '✓ Cached'
                             else:
@@ -374,7 +390,7 @@ class RepositoryTabHandler:
                     modified_text = "-"
                 
                 # Add to store
-                self.repo_store.append([
+                self.repo_store.insert_with_valuesv(-1, _REPO_ROW_COLUMNS, [
                     False,
                     script_id, 
                     name, 
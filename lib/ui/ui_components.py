@@ -77,6 +77,30 @@ class TreeViewFactory:
         column.set_min_width(width)
         tree.append_column(column)
     
+    @staticmethod
+    def use_fixed_row_height(tree, expand_column=None):
+        """
+        Switch a TreeView of single-line rows to fixed-height mode
+        
+        GTK then measures one row instead of every row on each relayout.
+        Fixed-height mode requires FIXED sizing on every column, so each
+        column keeps its minimum width as its starting (resizable) width.
+        
+        Args:
+            tree: TreeView whose columns have all been appended
+            expand_column: Optional column that takes up the spare width
+        """
+        for column in tree.get_columns():
+            column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
+            if column.get_fixed_width() < 1:
+                column.set_fixed_width(max(column.get_min_width(), 1))
+            for renderer in column.get_cells():
+                if isinstance(renderer, Gtk.CellRendererText):
+                    renderer.set_fixed_height_from_font(1)
+        if expand_column is not None:
+            expand_column.set_expand(True)
+        tree.set_fixed_height_mode(True)
+    
     @staticmethod
     def create_manifest_tree():
         """Create TreeView for manifest display"""
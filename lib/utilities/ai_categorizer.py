@@ -6,6 +6,7 @@ Uses Ollama for local AI-powered script analysis
 import json
 import subprocess
 from pathlib import Path
+from shutil import which
 from typing import Optional, Dict, List
 
 
@@ -26,6 +27,9 @@ class OllamaAnalyzer:
     
     def _check_ollama(self) -> bool:
         """Check if Ollama is installed and available"""
+        # Skip the fork/exec entirely when the binary is not on $PATH
+        if which('ollama') is None:
+            return False
         try:
             result = subprocess.run(
                 ['ollama', 'list'],
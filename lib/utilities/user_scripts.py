@@ -17,6 +17,14 @@ class CustomScriptManager:
         self.config_dir = Path.home() / '.lv_linux_learn'
         self.scripts_dir = self.config_dir / 'scripts'
         self.config_file = self.config_dir / 'custom_scripts.json'
+        # Parsed config, reused until the file's (mtime_ns, size) changes
+        self._config_cache = None
+        self._config_stamp = None
+        # {id: script} and {path: script} indexes, rebuilt when the config
+        # file's (mtime_ns, size) changes
+        self._id_index = {}
+        self._path_index = {}
+        self._index_stamp = None
         self._ensure_directories()
         
     def _ensure_directories(self):
@@ -26,22 +34,45 @@ class CustomScriptManager:
         if not self.config_file.exists():
             self._save_config({"scripts": []})
     
+    def _file_stamp(self):
+        """(mtime_ns, size) of the config file, or None if it cannot be stat'ed"""
+        try:
+            st = self.config_file.stat()
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+    
     def _load_config(self):
-        """Load configuration from JSON file"""
+        """Load configuration from JSON file (parsed once per file change)"""
+        stamp = self._file_stamp()
+        if stamp is not None and stamp == self._config_stamp:
+            return self._config_cache
         try:
             with open(self.config_file, 'r') as f:
-                return json.load(f)
+                config = json.load(f)
         except Exception as e:
             print(f"Warning: Failed to load custom scripts config: {e}")
             return {"scripts": []}
+        self._config_cache = config
+        self._config_stamp = stamp
+        return config
     
     def _save_config(self, config):
         """Save configuration to JSON file"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            # Write to a temporary file first, then rename
+            # (atomic) so a crash never leaves a torn config behind
+            temp_path = self.config_file.with_suffix('.tmp')
+            temp_path.write_text(json.dumps(config, indent=2))
+            temp_path.replace(self.config_file)
         except Exception as e:
             print(f"Warning: Failed to save custom scripts config: {e}")
+            # Callers edit the cached dict in place; force a re-read from disk
+            self._config_stamp = None
+            self._index_stamp = None
+            return
+        self._config_cache = config
+        self._config_stamp = self._file_stamp()
     
     def add_script(self, name, description, content):
         """Add a new custom script"""
@@ -86,44 +117,51 @@ class CustomScriptManager:
         """
         return self.list_scripts()
     
+    def _refresh_indexes(self):
+        """Rebuild the id/path indexes if the config file has changed"""
+        stamp = self._file_stamp()
+        if stamp is None or stamp != self._index_stamp:
+            scripts = self.list_scripts()
+            self._id_index = {s.get('id'): s for s in scripts}
+            self._path_index = {s.get('path'): s for s in scripts}
+            self._index_stamp = stamp
+    
+    def get_script_by_path(self, script_path):
+        """Get a custom script by its file path (dict lookup, no list scan)"""
+        self._refresh_indexes()
+        return self._path_index.get(str(script_path))
+    
     def get_script_by_id(self, script_id):
-        """Get a custom script by ID"""
-        config = self._load_config()
-        scripts = config.get('scripts', [])
-        
-        for script in scripts:
-            if script.get('id') == script_id:
-                return script
-        
-        return None
+        """Get a custom script by ID (dict lookup, no list scan)"""
+        self._refresh_indexes()
+        return self._id_index.get(script_id)
     
     def update_script(self, script_id, name=None, description=None, content=None):
         """Update an existing custom script"""
         config = self._load_config()
-        scripts = config.get('scripts', [])
+        # Edit the entry inside the config being saved; the id index is only
+        # for read-only lookups and may hold a different copy
+        script = next((s for s in config.get('scripts', []) if s.get('id') == script_id), None)
+        if script is None:
+            return False
         
-        for script in scripts:
-            if script.get('id') == script_id:
-                # Update metadata
-                if name is not None:
-                    script['name'] = name
-                if description is not None:
-                    script['description'] = description
-                
-                # Update script content if provided
-                if content is not None:
-                    script_path = Path(script.get('path'))
-                    if script_path.exists():
-                        with open(script_path, 'w') as f:
-                            f.write(content)
-                        script_path.chmod(0o755)
-                
-                script['modified'] = datetime.now().isoformat()
-                config['scripts'] = scripts
-                self._save_config(config)
-                return True
+        # Update metadata
+        if name is not None:
+            script['name'] = name
+        if description is not None:
+            script['description'] = description
         
-        return False
+        # Update script content if provided
+        if content is not None:
+            script_path = Path(script.get('path'))
+            if script_path.exists():
+                with open(script_path, 'w') as f:
+                    f.write(content)
+                script_path.chmod(0o755)
+        
+        script['modified'] = datetime.now().isoformat()
+        self._save_config(config)
+        return True
     
     def delete_script(self, script_id):
         """Delete a custom script by ID (alias for remove_script)"""
@@ -139,12 +177,10 @@ class CustomScriptManager:
         
         if removed:
             # Delete script file
-            for s in scripts:
-                if s.get('id') == script_id:
-                    script_path = s.get('path')
-                    if script_path and Path(script_path).exists():
-                        Path(script_path).unlink(missing_ok=True)
-                    break
+            removed_script = next((s for s in scripts if s.get('id') == script_id), {})
+            script_path = removed_script.get('path')
+            if script_path and Path(script_path).exists():
+                Path(script_path).unlink(missing_ok=True)
             
             config['scripts'] = new_scripts
             self._save_config(config)
@@ -12,8 +12,7 @@ try:
     import gi
     gi.require_version("Gtk", "3.0")
     gi.require_version("Vte", "2.91")
-    gi.require_version("GdkPixbuf", "2.0")
-    from gi.repository import Gtk, Gdk, GLib, Vte, Pango, GdkPixbuf
+    from gi.repository import Gtk, Gdk, GLib, Vte
 except (ImportError, ValueError) as e:
     print("ERROR: Missing required Python GTK dependencies!")
     print("\nThis application requires:")
@@ -26,17 +25,18 @@ except (ImportError, ValueError) as e:
     print(f"\nError details: {e}")
     sys.exit(1)
 
-import subprocess
-import webbrowser
 import shlex
 import json
-import urllib.request
-import urllib.error
 import time
 import hashlib
+import html
+import re
 from pathlib import Path
-from datetime import datetime
-import uuid
+import functools
+from shutil import which
+
+# Column indices of a full script row, for ListStore.insert_with_valuesv()
+_SCRIPT_ROW_COLUMNS = list(range(8))
 
 # Debug logging flag (disabled by default). Set LV_DEBUG_CACHE=1 to enable.
 DEBUG_CACHE = os.environ.get("LV_DEBUG_CACHE") == "1"
@@ -52,8 +52,6 @@ try:
         FileLoader,
         TimerManager
     )
-    from lib.ui.dialog_helpers_extended import show_confirmation, show_error, show_info, show_warning
-    from lib.ui.ui_components import create_filtered_treeview
 except ImportError as e:
     print(f"Warning: Utility modules not available: {e}")
     PathManager = None
@@ -120,14 +118,6 @@ except ImportError:
     print("Warning: UI helpers module not available")
     UI = None
 
-# AI tools
-try:
-    from lib.utilities.ai_categorizer import OllamaAnalyzer, check_ollama_available
-except ImportError:
-    print("Warning: AI analyzer module not available")
-    OllamaAnalyzer = None
-    check_ollama_available = None
-
 # Tab handlers (refactored UI components)
 try:
     from lib.ui.repository_tab import RepositoryTabHandler
@@ -175,12 +165,6 @@ except ImportError:
     validate_script_env_var = None
     build_script_command = None
 
-try:
-    # optional nicer icons / pixbuf usage if available
-    from gi.repository import GdkPixbuf
-except Exception:
-    GdkPixbuf = None
-
 # ============================================================================
 # CONFIGURATION & CONSTANTS
 # ============================================================================
@@ -242,10 +226,377 @@ TOOLS_DESCRIPTIONS = _DESCRIPTIONS_DICT.get('tools', [])
 EXERCISES_DESCRIPTIONS = _DESCRIPTIONS_DICT.get('exercises', [])
 UNINSTALL_DESCRIPTIONS = _DESCRIPTIONS_DICT.get('uninstall', [])
 
+# Basenames parallel to the script arrays, computed once per manifest load
+# instead of per row. Call _sync_script_basenames() after reloading arrays.
+SCRIPT_BASENAMES = [os.path.basename(p) for p in SCRIPTS]
+TOOLS_BASENAMES = [os.path.basename(p) for p in TOOLS_SCRIPTS]
+EXERCISES_BASENAMES = [os.path.basename(p) for p in EXERCISES_SCRIPTS]
+UNINSTALL_BASENAMES = [os.path.basename(p) for p in UNINSTALL_SCRIPTS]
+
+
+# Main tab key -> its (scripts, names, descriptions, basenames) arrays. The
+# arrays are reloaded in place, so these references stay valid; main tabs
+# occupy the first notebook pages in MAIN_TABS order.
+MAIN_TABS = ("install", "tools", "exercises", "uninstall")
+TAB_DATA = {
+    "install": (SCRIPTS, SCRIPT_NAMES, DESCRIPTIONS, SCRIPT_BASENAMES),
+    "tools": (TOOLS_SCRIPTS, TOOLS_NAMES, TOOLS_DESCRIPTIONS, TOOLS_BASENAMES),
+    "exercises": (EXERCISES_SCRIPTS, EXERCISES_NAMES, EXERCISES_DESCRIPTIONS, EXERCISES_BASENAMES),
+    "uninstall": (UNINSTALL_SCRIPTS, UNINSTALL_NAMES, UNINSTALL_DESCRIPTIONS, UNINSTALL_BASENAMES),
+}
+
+
+_TAB_COLUMN_HEADERS = {
+    "install": "Available Installs",
+    "tools": "Available Tools",
+    "exercises": "Bash Exercises",
+    "uninstall": "Uninstall Options",
+}
+
+
+def _sync_script_basenames():
+    """Recompute basename arrays in place after the script arrays change"""
+    SCRIPT_BASENAMES[:] = [os.path.basename(p) for p in SCRIPTS]
+    TOOLS_BASENAMES[:] = [os.path.basename(p) for p in TOOLS_SCRIPTS]
+    EXERCISES_BASENAMES[:] = [os.path.basename(p) for p in EXERCISES_SCRIPTS]
+    UNINSTALL_BASENAMES[:] = [os.path.basename(p) for p in UNINSTALL_SCRIPTS]
+
 # Global script ID mapping: (category, script_path) -> (script_id, source_name)
 # This allows metadata builder to retrieve script IDs without re-parsing manifests
 _SCRIPT_ID_MAP = {}
 
+def _flatten_manifest_scripts(manifest):
+    """Return a manifest's scripts as a flat list (handles nested category format)"""
+    scripts = manifest.get('scripts', [])
+    if isinstance(scripts, dict):
+        all_scripts = []
+        for category_scripts in scripts.values():
+            all_scripts.extend(category_scripts)
+        scripts = all_scripts
+    return scripts
+
+
+@functools.lru_cache(maxsize=1)
+def _cfg_dir():
+    """Config directory, resolved once for per-row lookups"""
+    return PathManager.get_config_dir() if PathManager else Path.home() / '.lv_linux_learn'
+
+
+@functools.lru_cache(maxsize=1)
+def _custom_dir():
+    """Custom manifests directory, resolved once for per-row lookups"""
+    return PathManager.get_custom_manifests_dir() if PathManager else _cfg_dir() / 'custom_manifests'
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_in_custom_dir(script_path):
+    """True if a (file://) script path resolves inside the custom manifests dir.
+    Memoized: Path.resolve() stats every component and runs per row per tab."""
+    try:
+        local_candidate = script_path.replace('file://', '') if script_path.startswith('file://') else script_path
+        return _custom_dir() in Path(local_candidate).resolve().parents
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _path_executables():
+    """Names of all entries in $PATH, gathered with one listdir per directory"""
+    names = set()
+    seen = set()
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        # Plain listdir: is_file() would stat every symlink in /usr/bin and
+        # friends, and a directory named like a required command is not a concern
+        try:
+            st = os.stat(directory or ".")
+            # On merged-/usr systems /bin and /sbin are symlinks to their
+            # /usr counterparts; list each real directory only once
+            if (st.st_dev, st.st_ino) in seen:
+                continue
+            seen.add((st.st_dev, st.st_ino))
+            names.update(os.listdir(directory or "."))
+        except OSError:
+            continue
+    return frozenset(names)
+
+
+def _path_stamp():
+    """(directory, mtime_ns) for each $PATH entry; adding or removing a
+    command changes its directory's mtime"""
+    stamp = []
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        try:
+            stamp.append([directory, os.stat(directory or ".").st_mtime_ns])
+        except OSError:
+            continue
+    return stamp
+
+
+# Case-folded column text for the repository views, which have no hidden
+# search-key column; names and categories repeat across rows and refilters
+_folded = functools.lru_cache(maxsize=4096)(str.casefold)
+
+# Absolute form of a script path. The app never changes its working
+# directory, so the result for a given path is fixed for the session;
+# repeat Run/View/Go To clicks skip the getcwd + normpath work
+_abspath = functools.lru_cache(maxsize=1024)(os.path.abspath)
+
+
+def _search_key(name, path):
+    """Case-folded search haystack stored with each script row"""
+    return f"{name}\0{path}".casefold()
+
+
+_DESC_PLACEHOLDER = "Select a script to see description."
+
+# Pango markup has no <a> element (only GtkLabel understands it). Links are
+# rewritten to styled spans bracketed by private-use marker characters, which
+# are located and removed after parsing so a "link:<uri>" tag can be applied
+_LINK_RE = re.compile(r'<a\b[^>]*?\bhref=(["\'])(.*?)\1[^>]*>(.*?)</a>', re.S)
+_LINK_TAG_RE = re.compile(r'</?a\b[^>]*>')
+_LINK_START = '\ue000'
+_LINK_END = '\ue001'
+
+
+@functools.lru_cache(maxsize=128)
+def _description_buffer(markup):
+    """TextBuffer with markup already parsed. Buffers are shared between
+    description views, so re-showing a description swaps buffers instead
+    of running the markup parser again."""
+    uris = []
+
+    def mark_link(match):
+        uris.append(html.unescape(match.group(2)))
+        return (f'{_LINK_START}<span underline="single" foreground="#3498db">'
+                f'{match.group(3)}</span>{_LINK_END}')
+
+    buffer = Gtk.TextBuffer()
+    markup = _LINK_TAG_RE.sub('', _LINK_RE.sub(mark_link, markup))
+    buffer.insert_markup(buffer.get_start_iter(), markup, -1)
+    if not uris:
+        return buffer
+
+    # Character offsets of each marker pair, in document order
+    text = buffer.get_text(buffer.get_start_iter(), buffer.get_end_iter(), True)
+    starts = [i for i, ch in enumerate(text) if ch == _LINK_START]
+    ends = [i for i, ch in enumerate(text) if ch == _LINK_END]
+    # Work right to left so the offsets still to be handled stay valid
+    for uri, start, end in reversed(list(zip(uris, starts, ends))):
+        buffer.delete(buffer.get_iter_at_offset(end), buffer.get_iter_at_offset(end + 1))
+        buffer.delete(buffer.get_iter_at_offset(start), buffer.get_iter_at_offset(start + 1))
+        name = f"link:{uri}"
+        tag = buffer.get_tag_table().lookup(name) or buffer.create_tag(name)
+        buffer.apply_tag(tag, buffer.get_iter_at_offset(start), buffer.get_iter_at_offset(end - 1))
+    return buffer
+
+
+def _set_description_markup(view, markup):
+    """Show Pango markup in a description TextView"""
+    view.set_buffer(_description_buffer(markup))
+
+
+@functools.lru_cache(maxsize=1)
+def _about_css_provider():
+    """White-text provider for the About label, parsed on first use"""
+    css_provider = Gtk.CssProvider()
+    css_provider.load_from_data(b"#about-label { color: #ffffff; }")
+    return css_provider
+
+
+def _open_link(label, uri):
+    """activate-link handler: open uri relative to the widget's window"""
+    # GIO launches the handler via g_spawn (posix_spawn) rather than
+    # forking this process the way webbrowser's Popen does
+    try:
+        Gtk.show_uri_on_window(label.get_toplevel(), uri, Gtk.get_current_event_time())
+    except (AttributeError, GLib.Error):
+        import webbrowser
+        webbrowser.open(uri)
+    return True
+
+
+def _on_description_release(view, event):
+    """button-release-event handler: open the link under the pointer"""
+    if event.button != 1 or view.get_buffer().get_has_selection():
+        return False
+    x, y = view.window_to_buffer_coords(Gtk.TextWindowType.WIDGET, int(event.x), int(event.y))
+    found, text_iter = view.get_iter_at_location(x, y)
+    if not found:
+        return False
+    for tag in text_iter.get_tags():
+        name = tag.props.name
+        if name and name.startswith("link:"):
+            return _open_link(view, name[len("link:"):])
+    return False
+
+
+@functools.lru_cache(maxsize=2048)
+def _escaped(text):
+    """Markup-escaped script name/path, kept across script reloads since
+    names and paths rarely change between manifests."""
+    return GLib.markup_escape_text(text)
+
+
+@functools.lru_cache(maxsize=1024)
+def _description_markup(name, path, description):
+    """Description pane markup: bold name + monospaced path, then description.
+    Memoized per row and shared by all windows. Keyed by the row's full
+    text, so entries cannot go stale and survive script reloads."""
+    return (
+        f"<big><b>{_escaped(name)}</b></big>\n"
+        f"<tt>{_escaped(path)}</tt>\n\n"
+        f"{description}"
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _decode_row_metadata(metadata_json):
+    """Decode a row's metadata JSON once; rows keep the same string until repopulated"""
+    return json.loads(metadata_json)
+
+
+# Shell command run in the terminal by "View Script"; built once, filled per click
+_VIEW_RULE = '=' * 80
+_VIEWER_CMD_TEMPLATE = (
+    "clear; "
+    "echo ''; "
+    f"echo '{_VIEW_RULE}'; "
+    "echo {viewing}; "
+    "echo {source}; "
+    "echo {type_label}; "
+    f"echo '{_VIEW_RULE}'; "
+    "echo ''; "
+    "{viewer}; "
+    "echo ''; "
+    f"echo '{_VIEW_RULE}'\n"
+)
+
+# Syntax highlighters in order of preference; plain cat when none is installed
+_VIEWERS = (
+    ("batcat", "batcat --paging=never --style=plain --color=always {path}"),
+    ("bat", "bat --paging=never --style=plain --color=always {path}"),
+    ("pygmentize", "pygmentize -g -f terminal256 {path}"),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _viewer_program():
+    """Highlighter command template, resolved once instead of probing with
+    command -v in the shell on every view"""
+    for command, template in _VIEWERS:
+        if _command_exists(command):
+            return template
+    return "cat {path}"
+
+
+@functools.lru_cache(maxsize=64)
+def _viewer_command(file_path, source_name, script_type_label):
+    """Encoded View Script shell command; repeat views of a script reuse it"""
+    path = shlex.quote(file_path)
+    return _VIEWER_CMD_TEMPLATE.format(
+        viewer=_viewer_program().format(path=path),
+        viewing=shlex.quote(f"Viewing: {file_path}"),
+        source=shlex.quote(f"Source: {source_name}"),
+        type_label=shlex.quote(f"Type: {script_type_label}"),
+    ).encode('utf-8', 'surrogateescape')
+
+
+@functools.lru_cache(maxsize=None)
+def _command_exists(cmd):
+    """Memoized command lookup: the $PATH scan rules out missing names
+    cheaply, and which() confirms a hit is an executable regular file
+    (the listing also holds directories, plain files and dangling symlinks)"""
+    if os.sep in cmd:
+        return which(cmd) is not None
+    return cmd in _path_executables() and which(cmd) is not None
+
+
+# Parsed custom manifests keyed by path -> ((mtime_ns, size), index)
+_MANIFEST_INDEX_CACHE = {}
+
+# Config-embedded custom manifests keyed by config path ->
+# ((mtime_ns, size), {manifest_name: index})
+_CONFIG_MANIFEST_INDEX_CACHE = {}
+
+
+def _iter_custom_manifest_paths(root):
+    """
+    Yield custom manifest paths under root using a single directory scan.
+    Per-repository <name>/manifest.json files are yielded before loose *.json files.
+    """
+    loose_manifests = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    sub_manifest = os.path.join(entry.path, 'manifest.json')
+                    if os.path.isfile(sub_manifest):
+                        yield sub_manifest
+                elif entry.is_file() and entry.name.endswith('.json') and entry.name != 'manifest.json':
+                    loose_manifests.append(entry.path)
+    except OSError:
+        return
+    yield from loose_manifests
+
+
+def _load_manifest_cached(manifest_path):
+    """
+    Load a manifest file and its flattened script list.
+    The parsed result is reused until the file's mtime or size changes.
+    
+    Returns: dict with 'manifest' and 'scripts' keys
+    """
+    manifest_path = str(manifest_path)
+    st = os.stat(manifest_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _MANIFEST_INDEX_CACHE.get(manifest_path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    
+    manifest = json.loads(Path(manifest_path).read_bytes())
+    
+    index = {'manifest': manifest, 'scripts': _flatten_manifest_scripts(manifest)}
+    _MANIFEST_INDEX_CACHE[manifest_path] = (stamp, index)
+    return index
+
+
+def _load_config_manifests_cached(repository):
+    """
+    Index the custom manifests embedded in the repository config.
+    Display names are pre-tagged once per config change so lookups are dict hits.
+    
+    Returns: dict of manifest_name -> {'manifest', 'scripts', 'by_display_name_local'}
+    """
+    config_file = str(repository.config_file)
+    try:
+        st = os.stat(config_file)
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+    cached = _CONFIG_MANIFEST_INDEX_CACHE.get(config_file)
+    if stamp is not None and cached and cached[0] == stamp:
+        return cached[1]
+    
+    indexes = {}
+    config = repository.load_config()
+    for manifest_name, manifest_config in config.get('custom_manifests', {}).items():
+        manifest_data = manifest_config.get('manifest_data')
+        if not manifest_data:
+            continue
+        scripts = _flatten_manifest_scripts(manifest_data)
+        by_display_name = {}
+        for script in scripts:
+            by_display_name.setdefault(f"{script.get('name', '')} [Local: {manifest_name}]", script)
+        indexes[manifest_name] = {
+            'manifest': manifest_data,
+            'scripts': scripts,
+            'by_display_name_local': by_display_name
+        }
+    
+    if stamp is not None:
+        _CONFIG_MANIFEST_INDEX_CACHE[config_file] = (stamp, indexes)
+    return indexes
+
 
 # ============================================================================
 # GTK THEME / CSS STYLING
@@ -813,6 +1164,7 @@ class UIRefreshCoordinator:
             UNINSTALL_SCRIPTS[:] = _scripts.get('uninstall', [])
             UNINSTALL_NAMES[:] = _names.get('uninstall', [])
             UNINSTALL_DESCRIPTIONS[:] = _descriptions.get('uninstall', [])
+            _sync_script_basenames()
             
             # Rebuild dynamic tabs using TabManager
             if hasattr(self.parent, 'tab_manager') and self.parent.repository:
@@ -865,8 +1217,11 @@ class ScriptActionHandler:
         if script_type == "local" or source_type == "local_repo":
             return self._view_local_script(script_path, source_name)
         
+        # One stat serves both the cached and fallback checks
+        is_file = script_type != "remote" and os.path.isfile(script_path)
+        
         # === CACHED: View from cache ===
-        if script_type == "cached" and os.path.isfile(script_path):
+        if script_type == "cached" and is_file:
             return self._view_file(script_path, source_name, "Cached Script")
         
         # === REMOTE: Download then view ===
@@ -874,7 +1229,7 @@ class ScriptActionHandler:
             return self._view_remote_script(script_path, metadata, source_type, source_name, script_name)
         
         # === FALLBACK: Try viewing if file exists ===
-        if os.path.isfile(script_path):
+        if is_file:
             return self._view_file(script_path, source_name, "Script")
         
         if TerminalMessenger:
@@ -895,8 +1250,11 @@ class ScriptActionHandler:
         if script_type == "local":
             return self._navigate_local(script_path)
         
+        # One stat serves both the cached and fallback checks
+        is_file = script_type != "remote" and os.path.isfile(script_path)
+        
         # === CACHED: Navigate to cache directory ===
-        if script_type == "cached" and os.path.isfile(script_path):
+        if script_type == "cached" and is_file:
             return self._navigate_to_file(script_path)
         
         # === REMOTE: Download then navigate ===
@@ -904,7 +1262,7 @@ class ScriptActionHandler:
             return self._navigate_remote_with_download(script_path, metadata, script_name)
         
         # === FALLBACK: Try navigating if file exists ===
-        if os.path.isfile(script_path):
+        if is_file:
             return self._navigate_to_file(script_path)
         
         if TerminalMessenger:
@@ -925,8 +1283,11 @@ class ScriptActionHandler:
         if script_type == "local":
             return self._execute_local(script_path, metadata)
         
+        # One stat serves both the cached and fallback checks
+        is_file = script_type != "remote" and os.path.isfile(script_path)
+        
         # === CACHED: Execute from cache ===
-        if script_type == "cached" and os.path.isfile(script_path):
+        if script_type == "cached" and is_file:
             return self._execute_file(script_path, metadata)
         
         # === REMOTE: Download then execute ===
@@ -934,7 +1295,7 @@ class ScriptActionHandler:
             return self._execute_remote_with_download(script_path, metadata, script_name)
         
         # === FALLBACK: Try executing if file exists ===
-        if os.path.isfile(script_path):
+        if is_file:
             return self._execute_file(script_path, metadata)
         
         if TerminalMessenger:
@@ -951,7 +1312,7 @@ class ScriptActionHandler:
         """View local repository script directly"""
         file_path = script_path[7:] if script_path.startswith('file://') else script_path
         if os.path.isfile(file_path):
-            abs_path = os.path.abspath(file_path)
+            abs_path = _abspath(file_path)
             return self._view_file(abs_path, source_name, "Local Repository Script")
         if TerminalMessenger:
             TerminalMessenger(self.terminal).error(f"Local script not found: {file_path}")
@@ -989,29 +1350,7 @@ class ScriptActionHandler:
     
     def _view_file(self, file_path, source_name, script_type_label):
         """View file with syntax highlighting"""
-        safe_path = shlex.quote(file_path)
-        viewer_cmd = (
-            f"clear; "
-            f"echo ''; "
-            f"echo '{'=' * 80}'; "
-            f"echo 'Viewing: {file_path}'; "
-            f"echo 'Source: {source_name}'; "
-            f"echo 'Type: {script_type_label}'; "
-            f"echo '{'=' * 80}'; "
-            f"echo ''; "
-            f"if command -v batcat >/dev/null 2>&1; then "
-            f"batcat --paging=never --style=plain --color=always {safe_path}; "
-            f"elif command -v bat >/dev/null 2>&1; then "
-            f"bat --paging=never --style=plain --color=always {safe_path}; "
-            f"elif command -v pygmentize >/dev/null 2>&1; then "
-            f"pygmentize -g -f terminal256 {safe_path}; "
-            f"else "
-            f"cat {safe_path}; "
-            f"fi; "
-            f"echo ''; "
-            f"echo '{'=' * 80}'\n"
-        )
-        self.terminal.feed_child(viewer_cmd.encode())
+        self.terminal.feed_child(_viewer_command(file_path, source_name, script_type_label))
         return True
     
     # ========================================================================
@@ -1050,12 +1389,12 @@ class ScriptActionHandler:
     
     def _navigate_to_file(self, file_path):
         """Navigate terminal to file's directory"""
-        abs_path = os.path.abspath(file_path)
+        abs_path = _abspath(file_path)
         directory = os.path.dirname(abs_path)
-        safe_dir = shlex.quote(directory)
+        # fsencode keeps undecodable filename bytes (surrogateescape) intact
+        safe_dir = os.fsencode(shlex.quote(directory))
         
-        cmd = f"clear && cd {safe_dir} && pwd && ls -lah\n"
-        self.terminal.feed_child(cmd.encode())
+        self.terminal.feed_child(b"clear && cd " + safe_dir + b" && pwd && ls -lah\n")
         if TerminalMessenger:
             TerminalMessenger(self.terminal).success(f"Navigated to: {directory}")
         else:
@@ -1100,28 +1439,26 @@ class ScriptActionHandler:
     
     def _execute_file(self, file_path, metadata):
         """Execute script file"""
-        abs_path = os.path.abspath(file_path)
+        abs_path = _abspath(file_path)
         
         # Determine if we should use cache engine
         use_cache = self._should_use_cache_engine(metadata)
         
         if use_cache:
             # Cache-based execution
-            safe_path = shlex.quote(abs_path)
-            cmd = f"bash {safe_path}\n"
-            self.terminal.feed_child(cmd.encode())
+            safe_path = os.fsencode(shlex.quote(abs_path))
+            self.terminal.feed_child(b"bash " + safe_path + b"\n")
             if TerminalMessenger:
                 TerminalMessenger(self.terminal).info(f"Executing cached script: {os.path.basename(file_path)}")
             else:
                 self.terminal.feed(f"\x1b[32m[*] Executing cached script: {os.path.basename(file_path)}\x1b[0m\r\n".encode())
         else:
             # Direct execution (local repos, custom scripts)
-            safe_path = shlex.quote(abs_path)
+            safe_path = os.fsencode(shlex.quote(abs_path))
             directory = os.path.dirname(abs_path)
-            safe_dir = shlex.quote(directory)
+            safe_dir = os.fsencode(shlex.quote(directory))
             
-            cmd = f"cd {safe_dir} && bash {safe_path}\n"
-            self.terminal.feed_child(cmd.encode())
+            self.terminal.feed_child(b"cd " + safe_dir + b" && bash " + safe_path + b"\n")
             if TerminalMessenger:
                 TerminalMessenger(self.terminal).info(f"Executing local script: {os.path.basename(file_path)}")
             else:
@@ -1172,22 +1509,18 @@ class ScriptActionHandler:
                 print(f"[DEBUG] custom_manifests keys: {list(custom_manifests.keys())}")
                 
                 if source_name in custom_manifests:
-                    # Custom manifest from config - use temp file
-                    cache_dir = PathManager.get_config_dir() if PathManager else Path.home() / '.lv_linux_learn'
-                    manifest_path = str(cache_dir / f"temp_{source_name}_manifest.json")
-                    
-                    # Ensure temp manifest exists with current data
+                    # Custom manifest from config - pass the parsed data
+                    # straight through instead of writing a temp file
                     manifest_data = custom_manifests[source_name].get('manifest_data')
                     if manifest_data:
-                        with open(manifest_path, 'w') as f:
-                            json.dump(manifest_data, f, indent=2)
-                        print(f"[DEBUG] Created temp manifest: {manifest_path}")
+                        manifest_path = manifest_data
                     else:
                         print(f"[DEBUG] No manifest_data found for {source_name}")
                 else:
                     print(f"[DEBUG] source_name '{source_name}' not found in custom_manifests")
             
-            print(f"[DEBUG] Using manifest_path: {manifest_path}")
+            if manifest_path:
+                print(f"[DEBUG] Using custom manifest: {self.repository._describe_manifest_source(manifest_path)}")
             result = self.repository.download_script(script_id, manifest_path=manifest_path)
             success = result[0] if isinstance(result, tuple) else result
             url = result[1] if isinstance(result, tuple) and len(result) > 1 else None
@@ -1241,6 +1574,9 @@ class ScriptActionHandler:
 class TabManager:
     """Centralized tab management for all repository types and dynamic categories"""
     
+    # Standard categories that should NOT become tabs (either they're already tabs or they're special)
+    EXCLUDED_CATEGORIES = frozenset({'install', 'tools', 'exercises', 'uninstall', 'includes'})
+    
     def __init__(self, notebook, parent_window):
         """
         Initialize TabManager
@@ -1263,6 +1599,9 @@ class TabManager:
         self.standard_widgets = set()
         self.repository_widgets = set()
         
+        # Contents of the dynamic tabs as last built (see dynamic_category_signature)
+        self.category_signature = None
+        
     def register_standard_tab(self, name, widget):
         """Register a standard tab (install, tools, exercises, uninstall)"""
         self.tabs_registry['standard'][name] = widget
@@ -1427,15 +1766,13 @@ class TabManager:
         
         # Clear existing dynamic tabs first
         self.clear_dynamic_tabs()
+        self.category_signature = self.dynamic_category_signature()
         
         # Get all scripts from unified source
         repo_scripts = self.get_all_repository_scripts(repository, config)
         
-        # Standard categories that should NOT become tabs (either they're already tabs or they're special)
-        excluded_categories = {'install', 'tools', 'exercises', 'uninstall', 'includes'}
-        
         # Find dynamic categories (categories that aren't standard and should get their own tabs)
-        dynamic_categories = set(repo_scripts.keys()) - excluded_categories
+        dynamic_categories = set(repo_scripts.keys()) - self.EXCLUDED_CATEGORIES
         
         if not dynamic_categories:
             return  # No dynamic categories
@@ -1481,6 +1818,17 @@ class TabManager:
                 'box': category_box
             }
     
+    def dynamic_category_signature(self):
+        """
+        Snapshot of the loaded dynamic-category scripts.
+        Equal signatures mean the dynamic tabs would be rebuilt identically.
+        """
+        return frozenset(
+            (category, tuple(paths), tuple(_NAMES_DICT.get(category, [])), tuple(_DESCRIPTIONS_DICT.get(category, [])))
+            for category, paths in _SCRIPTS_DICT.items()
+            if category not in self.EXCLUDED_CATEGORIES and paths
+        )
+    
     def _get_category_emoji(self, category):
         """Get appropriate emoji for category name"""
         category_lower = category.lower()
@@ -1527,6 +1875,7 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
         # Initialize window state config
         self.config_dir = PathManager.get_config_dir() if PathManager else Path.home() / '.lv_linux_learn'
         self.ui_config_file = PathManager.get_ui_state_file() if PathManager else self.config_dir / 'ui_state.json'
+        self.package_check_file = C.PACKAGE_CHECK_CACHE_FILE if C else self.config_dir / 'package_check.json'
         
         # Load saved window state or use defaults from constants
         window_state = self._load_window_state()
@@ -1575,6 +1924,27 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
         self.repo_enabled = False
         self.repo_config = {}  # Initialize early to avoid AttributeError
         self._auto_refresh_timeout_id = None  # Store timeout ID to prevent garbage collection
+        self._about_markup_cache = {}  # (script counts) -> About dialog markup
+        self._about_dialog = None  # Built on first Help > About, then hidden and reused
+        self._terminal_menu = None  # Terminal right-click menu, built on first use
+        self._about_label = None
+        self._about_key = None  # cache key of the markup currently set on _about_label
+        self._shown_desc_markup = {}  # description label -> markup string last set on it
+        self._pending_desc_markup = {}  # description label -> markup waiting for the idle update
+        self._desc_idle_id = None  # Idle source applying _pending_desc_markup
+        self.filter_text = ""  # Lowercased search query shared by all filter models
+        self._filter_misses = set()  # search keys of rows known not to match filter_text
+        self._filter_hits = set()  # search keys of rows known to match filter_text
+        self._filter_tokens = None  # words of a multi-word filter_text, else None
+        self._stale_filters = set()  # script tab filters not yet refiltered for filter_text
+        self._last_manifest_sha = None  # sha256 of manifest used for the last full rebuild
+        self._refresh_pending_id = None  # Debounce timer for manual manifest refresh
+        self._manifest_refresh_thread = None  # Worker fetching manifests off the main loop
+        
+        # Resolve optional refresh hooks once instead of probing with hasattr on every tick
+        self._refresh_ui_silent_cb = getattr(self, '_refresh_ui_silent', None)
+        self._update_repo_status_cb = getattr(self, '_update_repo_status', None)
+        self._populate_repository_tree_cb = getattr(self, '_populate_repository_tree', None)
         
         if ScriptRepository:
             try:
@@ -1640,6 +2010,7 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
                 UNINSTALL_SCRIPTS[:] = _SCRIPTS_DICT.get('uninstall', [])
                 UNINSTALL_NAMES[:] = _NAMES_DICT.get('uninstall', [])
                 UNINSTALL_DESCRIPTIONS[:] = _DESCRIPTIONS_DICT.get('uninstall', [])
+                _sync_script_basenames()
                 
                 print(f"[✓] Scripts reloaded successfully")
             except Exception as e:
@@ -1666,16 +2037,13 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
         main_paned = Gtk.Paned(orientation=Gtk.Orientation.VERTICAL)
         self.add(main_paned)
 
-        # Top section - tabs
-        top_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        top_box.set_size_request(-1, 300)  # Minimum height to keep tabs visible
-
-        # Create notebook (tabs)
+        # Top section - tabs. The notebook goes straight into the paned;
+        # a single-child Box would only add another measure pass.
         self.notebook = Gtk.Notebook()
         self.notebook.set_tab_pos(Gtk.PositionType.TOP)
         self.notebook.set_scrollable(True)  # Enable scrollable tabs for small windows
         self.notebook.set_show_border(False)
-        top_box.pack_start(self.notebook, True, True, 0)
+        self.notebook.set_size_request(-1, 300)  # Minimum height to keep tabs visible
         
         # Initialize centralized tab manager
         self.tab_manager = TabManager(self.notebook, self)
@@ -1689,23 +2057,16 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
         self.notebook.append_page(install_box, install_tab_label)
         self.tab_manager.register_standard_tab('install', self.install_treeview)
 
-        # Create Tools tab
-        tools_box = self._create_script_tab(TOOLS_SCRIPTS, TOOLS_DESCRIPTIONS, "tools")
-        tools_tab_label = self._create_tab_label("🔧 Tools", "tools")
-        self.notebook.append_page(tools_box, tools_tab_label)
-        self.tab_manager.register_standard_tab('tools', self.tools_treeview)
-
-        # Create Exercises tab
-        exercises_box = self._create_script_tab(EXERCISES_SCRIPTS, EXERCISES_DESCRIPTIONS, "exercises")
-        exercises_tab_label = self._create_tab_label("📚 Exercises", "exercises")
-        self.notebook.append_page(exercises_box, exercises_tab_label)
-        self.tab_manager.register_standard_tab('exercises', self.exercises_treeview)
-
-        # Create Uninstall tab
-        uninstall_box = self._create_script_tab(UNINSTALL_SCRIPTS, UNINSTALL_DESCRIPTIONS, "uninstall")
-        uninstall_tab_label = self._create_tab_label("⚠️ Uninstall", "uninstall")
-        self.notebook.append_page(uninstall_box, uninstall_tab_label)
-        self.tab_manager.register_standard_tab('uninstall', self.uninstall_treeview)
+        # Tools, Exercises and Uninstall start as empty placeholder pages;
+        # _ensure_script_tab() builds each one the first time it is shown
+        self._unbuilt_tabs = {}
+        for tab_name, label_text in (("tools", "🔧 Tools"),
+                                     ("exercises", "📚 Exercises"),
+                                     ("uninstall", "⚠️ Uninstall")):
+            placeholder = Gtk.Box()
+            self.notebook.append_page(placeholder, self._create_tab_label(label_text, tab_name))
+            self.tab_manager.register_standard_tab(tab_name, placeholder)
+            self._unbuilt_tabs[tab_name] = placeholder
         
         # Create dynamic category tabs using centralized TabManager
         if self.repository:
@@ -1749,7 +2110,7 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
                 print(f"Error creating custom manifest tab handler: {e}")
 
         # Add top section to paned widget (resize=False keeps user-set size, shrink=False maintains minimum)
-        main_paned.pack1(top_box, resize=False, shrink=False)
+        main_paned.pack1(self.notebook, resize=False, shrink=False)
 
         # Bottom section - embedded terminal
         terminal_frame = Gtk.Frame()
@@ -1827,7 +2188,8 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
         self.current_tab = "install"
         self.notebook.connect("switch-page", self.on_tab_switched)
 
-        # wire search -> both filters
+        # wire search -> filters. search-changed (unlike "changed") is already
+        # held back until typing pauses for 150 ms, so no extra timer is needed
         self.header_search.connect("search-changed", self.on_search_changed)
         
         # Initialize repository action handler for extracted event handlers
@@ -1841,8 +2203,9 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
         # Initialize terminal with bash shell
         GLib.idle_add(self._init_terminal)
 
-        # Check required packages on launch
-        GLib.idle_add(self.check_required_packages)
+        # Check required packages on launch; the scan runs on a worker
+        # thread, so start it now rather than from a main-loop idle
+        self.check_required_packages()
     
     def _load_window_state(self):
         """Load saved window state from config file"""
@@ -1917,15 +2280,32 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
 
     def _init_terminal(self):
         """Initialize the terminal with a bash shell"""
-        self.terminal.spawn_sync(
-            Vte.PtyFlags.DEFAULT,
-            os.getcwd(),
-            ["/bin/bash"],
-            None,
-            GLib.SpawnFlags.DEFAULT,
-            None,
-            None
-        )
+        # spawn_async (VTE >= 0.48) returns before bash has been forked and
+        # exec'd, so the first frame is not held up by the shell starting
+        if hasattr(self.terminal, "spawn_async"):
+            self.terminal.spawn_async(
+                Vte.PtyFlags.DEFAULT,
+                os.getcwd(),
+                ["/bin/bash"],
+                None,
+                GLib.SpawnFlags.DEFAULT,
+                None,
+                None,
+                -1,
+                None,
+                None,
+                None
+            )
+        else:
+            self.terminal.spawn_sync(
+                Vte.PtyFlags.DEFAULT,
+                os.getcwd(),
+                ["/bin/bash"],
+                None,
+                GLib.SpawnFlags.DEFAULT,
+                None,
+                None
+            )
         return False  # Remove idle handler
 
     # ========================================================================
@@ -1946,15 +2326,8 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
             True if script is in cache, False otherwise
         """
         # Local custom repos should never use cache engine
-        if script_path:
-            try:
-                local_candidate = script_path.replace('file://', '') if script_path.startswith('file://') else script_path
-                path_obj = Path(local_candidate).resolve()
-                custom_root = PathManager.get_custom_manifests_dir() if PathManager else Path.home() / '.lv_linux_learn' / 'custom_manifests'
-                if custom_root in path_obj.parents:
-                    return False
-            except Exception:
-                pass
+        if script_path and _is_in_custom_dir(script_path):
+            return False
 
         # Use is_script_cached function if available
         if is_script_cached:
@@ -2172,16 +2545,15 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
             COL_METADATA = C.COL_METADATA if C else 5
             COL_SCRIPT_ID = C.COL_SCRIPT_ID if C else 6
             
-            metadata_json = model[treeiter][COL_METADATA]
+            metadata_json, script_id = model.get(treeiter, COL_METADATA, COL_SCRIPT_ID)
             if metadata_json:
-                metadata = json.loads(metadata_json)
+                # Copy: callers may annotate the dict, the decoded one is shared
+                metadata = dict(_decode_row_metadata(metadata_json))
                 # Also include script_id from column 6 if not already in metadata
-                if 'script_id' not in metadata or not metadata['script_id']:
-                    script_id = model[treeiter][COL_SCRIPT_ID]
-                    if script_id:
-                        metadata['script_id'] = script_id
+                if not metadata.get('script_id') and script_id:
+                    metadata['script_id'] = script_id
                 return metadata
-        except (IndexError, json.JSONDecodeError) as e:
+        except (IndexError, ValueError, json.JSONDecodeError) as e:
             print(f"Warning: Failed to parse script metadata: {e}")
         return {}
 
@@ -2388,7 +2760,7 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
         if script_type == "local" or source_type == "custom_local":
             file_path = script_path[7:] if script_path.startswith('file://') else script_path
             if os.path.isfile(file_path):
-                abs_path = os.path.abspath(file_path)
+                abs_path = _abspath(file_path)
                 # Execute in subshell to prevent terminal blocking
                 command = f"{env_exports}bash '{abs_path}'\n"
                 self.terminal.feed(f"\x1b[33m[*] Executing Local Custom script: {script_name}\x1b[0m\r\n".encode())
@@ -2455,7 +2827,7 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
         if script_type == "local" or source_type == "custom_local":
             file_path = script_path[7:] if script_path.startswith('file://') else script_path
             if os.path.isfile(file_path):
-                directory = os.path.dirname(os.path.abspath(file_path))
+                directory = os.path.dirname(_abspath(file_path))
                 command = f"cd '{directory}' && pwd\n"
                 self.terminal.feed(f"\x1b[33m[*] Navigating to Local Custom script directory\x1b[0m\r\n".encode())
                 self.terminal.feed(f"\x1b[36m[*] Source: {source_name}\x1b[0m\r\n".encode())
@@ -2549,7 +2921,9 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
 
     def _create_script_tab(self, scripts, descriptions, tab_name, names=None):
         """Create a tab with script list and description panel. Merges static scripts with repository scripts."""
-        main_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=16)
+        # One grid for list, description and buttons: a single size-request pass
+        # Columns: 0=script list, 1-3=description above the three action buttons
+        main_box = Gtk.Grid(column_spacing=8, row_spacing=12)
         main_box.set_border_width(12)
 
         # Get the appropriate names array
@@ -2566,10 +2940,12 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
                 # Fallback for any unexpected tab names
                 names = []
 
-        # store: icon, display name, full path, description, is_custom (bool), metadata (str as JSON), script_id
+        # store: icon, display name, full path, description, is_custom (bool), metadata (str as JSON), script_id,
+        # then a case-folded "name\0path" key so the search filter does one substring test per row
         # Use constants for column indices to prevent bugs
-        # COL_ICON=0, COL_NAME=1, COL_PATH=2, COL_DESCRIPTION=3, COL_IS_CUSTOM=4, COL_METADATA=5, COL_SCRIPT_ID=6
-        liststore = Gtk.ListStore(str, str, str, str, bool, str, str)
+        # COL_ICON=0, COL_NAME=1, COL_PATH=2, COL_DESCRIPTION=3, COL_IS_CUSTOM=4, COL_METADATA=5, COL_SCRIPT_ID=6,
+        # COL_SEARCH_KEY=7
+        liststore = Gtk.ListStore(str, str, str, str, bool, str, str, str)
 
 
         
@@ -2609,11 +2985,13 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
                         metadata["file_exists"] = True
                         pass  # removed debug log
             
-            liststore.append([icon, display_name, path_to_store, description, False, json.dumps(metadata), script_id])
+            liststore.insert_with_valuesv(-1, _SCRIPT_ROW_COLUMNS, [icon, display_name, path_to_store, description, False, json.dumps(metadata), script_id, _search_key(display_name, path_to_store)])
 
         # filtered model driven by search entry
         filter_model = liststore.filter_new()
-        filter_model.set_visible_func(self._filter_func, tab_name)
+        # Script tabs get a dedicated visible func with the key column as user
+        # data, so the per-row call skips the repository-tab dispatch
+        filter_model.set_visible_func(self._script_filter_func, C.COL_SEARCH_KEY if C else 7)
 
         # Store references for both tabs
         if tab_name == "install":
@@ -2638,35 +3016,33 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
         renderer = Gtk.CellRendererText()
         
         # Set column header based on tab type
-        if tab_name == "install":
-            column_header = "Available Installs"
-        elif tab_name == "tools":
-            column_header = "Available Tools"
-        elif tab_name == "exercises":
-            column_header = "Bash Exercises"
-        elif tab_name == "uninstall":
-            column_header = "Uninstall Options"
-        else:
-            column_header = "Scripts"
+        column_header = _TAB_COLUMN_HEADERS.get(tab_name, "Scripts")
         
         # Create columns for icon and name (use constants)
         COL_ICON = C.COL_ICON if C else 0
         COL_NAME = C.COL_NAME if C else 1
         ICON_WIDTH = C.ICON_COLUMN_WIDTH if C else 30
         
+        # Row height comes from the font metrics, not from measuring cell text
+        renderer.set_fixed_height_from_font(1)
         icon_column = Gtk.TreeViewColumn("", renderer, text=COL_ICON)
+        icon_column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
         icon_column.set_fixed_width(ICON_WIDTH)
         treeview.append_column(icon_column)
         
         name_renderer = Gtk.CellRendererText()
+        name_renderer.set_fixed_height_from_font(1)
         name_column = Gtk.TreeViewColumn(column_header, name_renderer, text=COL_NAME)
+        name_column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
+        name_column.set_expand(True)
         treeview.append_column(name_column)
+        # Single-line rows: measure one row instead of laying out every cell
+        treeview.set_fixed_height_mode(True)
         treeview.set_activate_on_single_click(False)
         treeview.get_selection().set_mode(Gtk.SelectionMode.SINGLE)
         # double-click/enter to run
         treeview.connect("row-activated", self.on_row_activated)
-        # selection changed handler
-        treeview.get_selection().connect("changed", self.on_selection_changed)
+        # selection changed handler is connected once the pane widgets exist
         # right-click menu for custom scripts
         treeview.connect("button-press-event", self.on_treeview_button_press)
 
@@ -2683,35 +3059,38 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
             # Dynamic category - store with category name
             setattr(self, f'{tab_name}_treeview', treeview)
 
-        scroll = Gtk.ScrolledWindow()
-        scroll.set_hexpand(True)
-        scroll.set_vexpand(True)
-        scroll.set_min_content_width(200)
-        scroll.set_max_content_width(400)
-        scroll.set_name("scroll")
-        scroll.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
+        # Widgets below are configured through construct properties, so each
+        # is built in one g_object_new call rather than a setter per property
+        scroll = Gtk.ScrolledWindow(
+            name="scroll",
+            hexpand=True,
+            vexpand=True,
+            min_content_width=200,
+            max_content_width=400,
+            hscrollbar_policy=Gtk.PolicyType.AUTOMATIC,
+            vscrollbar_policy=Gtk.PolicyType.AUTOMATIC,
+            margin_end=8,  # 16px gutter together with column spacing
+        )
         scroll.add(treeview)
-        main_box.pack_start(scroll, False, True, 0)
-
-        right_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        main_box.pack_start(right_box, True, True, 0)
-
-        # Description area
-        description_label = Gtk.Label()
-        description_label.set_line_wrap(True)
-        description_label.set_line_wrap_mode(Pango.WrapMode.WORD_CHAR)
-        description_label.set_max_width_chars(80)
-        description_label.set_name("desc_label")
-        description_label.set_xalign(0)
-        description_label.set_yalign(0)
-        description_label.set_use_markup(True)
-        description_label.set_selectable(True)
-        description_label.connect("activate-link", self.on_link_clicked)
-        description_label.set_text("Select a script to see description.")
-        description_label.set_margin_top(6)
-        description_label.set_margin_bottom(6)
-        description_label.set_margin_start(6)
-        description_label.set_margin_end(6)
+        main_box.attach(scroll, 0, 0, 1, 2)
+
+        # Description area: a read-only TextView keeps its line layout across
+        # allocations, where a wrapping markup GtkLabel re-measures every time
+        # Starts on the shared placeholder buffer rather than allocating and
+        # filling a buffer of its own
+        description_label = Gtk.TextView(
+            buffer=_description_buffer(_DESC_PLACEHOLDER),
+            name="desc_label",
+            editable=False,
+            cursor_visible=False,
+            wrap_mode=Gtk.WrapMode.WORD_CHAR,
+            left_margin=6,
+            right_margin=6,
+            top_margin=6,
+            bottom_margin=6,
+        )
+        # Links in descriptions are "link:<uri>" tags; open them on click
+        description_label.connect("button-release-event", _on_description_release)
 
         # Store label reference
         if tab_name == "install":
@@ -2726,32 +3105,39 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
             # Dynamic category - store with category name
             setattr(self, f'{tab_name}_description_label', description_label)
 
-        desc_scroll = Gtk.ScrolledWindow()
-        desc_scroll.set_vexpand(True)
-        desc_scroll.set_hexpand(True)
-        desc_scroll.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
+        # No horizontal scrolling: the label wraps to the allocated width in
+        # one height-for-width pass instead of re-measuring for a scrollbar
+        desc_scroll = Gtk.ScrolledWindow(
+            hexpand=True,
+            vexpand=True,
+            hscrollbar_policy=Gtk.PolicyType.NEVER,
+            vscrollbar_policy=Gtk.PolicyType.AUTOMATIC,
+        )
         desc_scroll.add(description_label)
-        right_box.pack_start(desc_scroll, True, True, 0)
-
-        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        button_box.set_homogeneous(False)  # Allow buttons to size naturally
-        right_box.pack_end(button_box, False, False, 0)
+        main_box.attach(desc_scroll, 1, 0, 3, 1)
 
-        view_button = Gtk.Button(label="View Script")
-        view_button.set_sensitive(False)
+        view_button = Gtk.Button(label="View Script", sensitive=False, hexpand=True)
         view_button.connect("clicked", self.on_view_clicked)
-        button_box.pack_start(view_button, True, True, 0)
+        main_box.attach(view_button, 1, 1, 1, 1)
 
-        cd_button = Gtk.Button(label="Go to Directory")
-        cd_button.set_sensitive(False)
+        cd_button = Gtk.Button(label="Go to Directory", sensitive=False, hexpand=True)
         cd_button.connect("clicked", self.on_cd_clicked)
-        button_box.pack_start(cd_button, True, True, 0)
+        main_box.attach(cd_button, 2, 1, 1, 1)
 
-        run_button = Gtk.Button(label="Run Script in Terminal")
-        run_button.set_sensitive(False)
+        run_button = Gtk.Button(label="Run Script in Terminal", sensitive=False, hexpand=True)
         run_button.get_style_context().add_class("suggested-action")
         run_button.connect("clicked", self.on_run_clicked)
-        button_box.pack_start(run_button, True, True, 0)
+        main_box.attach(run_button, 3, 1, 1, 1)
+
+        # Bind this tab's pane widgets as user data so each emission (one per
+        # cursor keypress) skips the get_current_widgets() dispatch
+        pane_widgets = {
+            'description_label': description_label,
+            'run_button': run_button,
+            'view_button': view_button,
+            'cd_button': cd_button,
+        }
+        treeview.get_selection().connect("changed", self.on_selection_changed, pane_widgets)
 
         # Store button references
         if tab_name == "install":
@@ -2780,18 +3166,10 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
 
     def on_tab_switched(self, notebook, page, page_num):
         """Handle tab switching (including dynamic categories from all repository types)"""
-        if page_num == 0:
-            self.current_tab = "install"
-            treeview = self.install_treeview
-        elif page_num == 1:
-            self.current_tab = "tools"
-            treeview = self.tools_treeview
-        elif page_num == 2:
-            self.current_tab = "exercises"
-            treeview = self.exercises_treeview
-        elif page_num == 3:
-            self.current_tab = "uninstall"
-            treeview = self.uninstall_treeview
+        if page_num < len(MAIN_TABS):
+            self.current_tab = MAIN_TABS[page_num]
+            self._ensure_script_tab(self.current_tab)
+            treeview = getattr(self, f'{self.current_tab}_treeview')
         else:
             # Check if this is a dynamic category tab
             page = notebook.get_nth_page(page_num)
@@ -2807,13 +3185,20 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
                     self.current_tab = category
                     treeview = getattr(self, f'{category}_treeview')
                 else:
-                    # Other tabs (Repository, Sources, etc.) - no script filtering needed
+                    # Other tabs (Repository, Sources, etc.) - no script filtering
+                    # needed, but a repository view may have missed a query change
+                    self._catch_up_repo_filters(page)
                     return
             else:
                 return
         
-        # Reapply search filter
+        # Reapply search filter, catching this tab up if it was hidden
+        # when the query last changed
         self.on_search_changed(self.header_search)
+        filter_model = treeview.get_model()
+        if filter_model in self._stale_filters:
+            self._stale_filters.discard(filter_model)
+            filter_model.refilter()
         
         # Auto-select first item if nothing is selected
         selection = treeview.get_selection()
@@ -2825,51 +3210,31 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
                 # Trigger the selection changed event
                 self.on_selection_changed(selection)
 
+    def _ensure_script_tab(self, tab_name):
+        """Build a deferred main script tab into its placeholder page"""
+        placeholder = self._unbuilt_tabs.pop(tab_name, None)
+        if placeholder is None:
+            return
+        scripts, _, descriptions, _ = TAB_DATA[tab_name]
+        tab_box = self._create_script_tab(scripts, descriptions, tab_name)
+        placeholder.pack_start(tab_box, True, True, 0)
+        placeholder.show_all()
+        self.tab_manager.register_standard_tab(tab_name, getattr(self, f'{tab_name}_treeview'))
+
     def get_current_widgets(self):
         """Get widgets for current tab"""
-        if self.current_tab == "install":
-            return {
-                'treeview': self.install_treeview,
-                'description_label': self.install_description_label,
-                'run_button': self.install_run_button,
-                'view_button': self.install_view_button,
-                'cd_button': self.install_cd_button,
-                'filter': self.install_filter,
-                'scripts': SCRIPTS,
-                'descriptions': DESCRIPTIONS
-            }
-        elif self.current_tab == "tools":
-            return {
-                'treeview': self.tools_treeview,
-                'description_label': self.tools_description_label,
-                'run_button': self.tools_run_button,
-                'view_button': self.tools_view_button,
-                'cd_button': self.tools_cd_button,
-                'filter': self.tools_filter,
-                'scripts': TOOLS_SCRIPTS,
-                'descriptions': TOOLS_DESCRIPTIONS
-            }
-        elif self.current_tab == "exercises":
+        tab_data = TAB_DATA.get(self.current_tab)
+        if tab_data is not None:
+            tab = self.current_tab
             return {
-                'treeview': self.exercises_treeview,
-                'description_label': self.exercises_description_label,
-                'run_button': self.exercises_run_button,
-                'view_button': self.exercises_view_button,
-                'cd_button': self.exercises_cd_button,
-                'filter': self.exercises_filter,
-                'scripts': EXERCISES_SCRIPTS,
-                'descriptions': EXERCISES_DESCRIPTIONS
-            }
-        elif self.current_tab == "uninstall":
-            return {
-                'treeview': self.uninstall_treeview,
-                'description_label': self.uninstall_description_label,
-                'run_button': self.uninstall_run_button,
-                'view_button': self.uninstall_view_button,
-                'cd_button': self.uninstall_cd_button,
-                'filter': self.uninstall_filter,
-                'scripts': UNINSTALL_SCRIPTS,
-                'descriptions': UNINSTALL_DESCRIPTIONS
+                'treeview': getattr(self, f'{tab}_treeview'),
+                'description_label': getattr(self, f'{tab}_description_label'),
+                'run_button': getattr(self, f'{tab}_run_button'),
+                'view_button': getattr(self, f'{tab}_view_button'),
+                'cd_button': getattr(self, f'{tab}_cd_button'),
+                'filter': getattr(self, f'{tab}_filter'),
+                'scripts': tab_data[0],
+                'descriptions': tab_data[2]
             }
         else:
             # Check for dynamic category tabs (stored with setattr)
@@ -2997,80 +3362,178 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
     # ========================================================================
 
     def check_required_packages(self):
-        """Check for required packages and prompt to install if missing"""
-        missing = []
-        for pkg in REQUIRED_PACKAGES:
-            if not self.command_exists(pkg):
-                missing.append(pkg)
-        
-        if missing:
-            self.show_install_prompt(missing)
+        """Check for required packages in a background thread, then prompt on the main loop"""
+        import threading
+
+        threading.Thread(target=self._check_packages_bg, daemon=True).start()
+        return False
+
+    def _check_packages_bg(self):
+        """Scan $PATH off the main loop and hand any missing packages back via idle_add"""
+        # Reuse the last verdict while no $PATH directory has changed, so
+        # most launches stat a handful of directories instead of listing them
+        path_stamp = _path_stamp()
+        cached = self._load_package_check(path_stamp)
+        if cached is not None:
+            missing, missing_optional = cached
         else:
+            missing = [pkg for pkg in REQUIRED_PACKAGES if not _command_exists(pkg)]
             # Check optional packages and inform user
-            missing_optional = []
-            for i, cmd in enumerate(OPTIONAL_COMMANDS):
-                if not self.command_exists(cmd):
-                    missing_optional.append(OPTIONAL_PACKAGES[i])
-            
-            if missing_optional:
-                self.show_optional_packages_info(missing_optional)
-        
-        return False  # remove idle handler after run once
+            missing_optional = [
+                OPTIONAL_PACKAGES[i] for i, cmd in enumerate(OPTIONAL_COMMANDS)
+                if not _command_exists(cmd)
+            ]
+            self._save_package_check(path_stamp, missing, missing_optional)
+
+        if missing:
+            GLib.idle_add(self._prompt_missing_packages, missing, None)
+        elif missing_optional:
+            GLib.idle_add(self._prompt_missing_packages, None, missing_optional)
+
+    def _load_package_check(self, path_stamp):
+        """Return cached (missing, missing_optional) if $PATH is unchanged, else None"""
+        try:
+            with open(self.package_check_file, 'r') as f:
+                cached = json.load(f)
+            if (cached.get('path_stamp') == path_stamp
+                    and cached.get('required') == list(REQUIRED_PACKAGES)
+                    and cached.get('optional') == list(OPTIONAL_COMMANDS)):
+                return cached['missing'], cached['missing_optional']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        return None
+
+    def _save_package_check(self, path_stamp, missing, missing_optional):
+        """Persist the package check verdict keyed by the $PATH stamp"""
+        try:
+            self.package_check_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.package_check_file, 'w') as f:
+                json.dump({
+                    'path_stamp': path_stamp,
+                    'required': list(REQUIRED_PACKAGES),
+                    'optional': list(OPTIONAL_COMMANDS),
+                    'missing': missing,
+                    'missing_optional': missing_optional,
+                }, f)
+        except OSError as e:
+            print(f"Warning: Failed to save package check: {e}")
+
+    def _prompt_missing_packages(self, missing, missing_optional):
+        """Show the install prompt or optional-packages info on the main loop"""
+        if missing:
+            self.show_install_prompt(missing)
+        elif missing_optional:
+            self.show_optional_packages_info(missing_optional)
+        return False
 
     def _filter_func(self, model, iter, tab_name):
-        if not hasattr(self, 'filter_text'):
-            self.filter_text = ""
-        if not self.filter_text:
+        # Called once per row on every refilter: bind the query locally and
+        # read all needed columns in a single model.get call
+        text = self.filter_text
+        if not text:
             return True
         
         if tab_name == "repository":
             # For repository tab: search in script name (column 2) and category (column 5)
-            name = model[iter][2].lower()  # Script name column
-            category = model[iter][5].lower()  # Category column
-            return self.filter_text in name or self.filter_text in category
-        elif tab_name == "local_repositories":
+            name, category = model.get(iter, 2, 5)
+            if self._filter_tokens is None:
+                return text in _folded(name) or text in _folded(category)
+            haystack = f"{_folded(name)}\0{_folded(category)}"
+        else:
             # For local repository tab: search in script name (column 2), category (column 5), and repository (column 6)
-            name = model[iter][2].lower()  # Script name column
-            category = model[iter][5].lower()  # Category column
-            repository = model[iter][6].lower()  # Repository column
-            return self.filter_text in name or self.filter_text in category or self.filter_text in repository
+            name, category, repository = model.get(iter, 2, 5, 6)
+            if self._filter_tokens is None:
+                return text in _folded(name) or text in _folded(category) or text in _folded(repository)
+            haystack = f"{_folded(name)}\0{_folded(category)}\0{_folded(repository)}"
+        return all(token in haystack for token in self._filter_tokens)
+
+    def _script_filter_func(self, model, iter, key_column):
+        # Script tabs: one substring test over the case-folded "name\0path" key
+        text = self.filter_text
+        if not text:
+            return True
+        key = model.get_value(iter, key_column)
+        if key in self._filter_hits:
+            return True
+        misses = self._filter_misses
+        if key in misses:
+            return False
+        tokens = self._filter_tokens
+        if tokens is None:
+            matched = text in key
         else:
-            # For main tabs: search in display name (column 0) and path (column 1)
-            name = model[iter][0].lower()
-            path = model[iter][1].lower()
-            return self.filter_text in name or self.filter_text in path
+            matched = all(token in key for token in tokens)
+        if matched:
+            self._filter_hits.add(key)
+            return True
+        misses.add(key)
+        return False
 
     def on_search_changed(self, entry):
-        self.filter_text = entry.get_text().strip().lower()
-        self.install_filter.refilter()
-        self.tools_filter.refilter()
-        self.exercises_filter.refilter()
-        self.uninstall_filter.refilter()
-        # Filter repository tabs if they exist
-        if hasattr(self, 'repo_filter'):
-            self.repo_filter.refilter()
-        if hasattr(self, 'local_repo_filter'):
-            self.local_repo_filter.refilter()
-        # Filter dynamic category tabs
-        if hasattr(self, 'dynamic_categories'):
-            for category in self.dynamic_categories.keys():
-                filter_attr = f'{category}_filter'
-                if hasattr(self, filter_attr):
-                    getattr(self, filter_attr).refilter()
-        # Filter dynamic category tabs
+        # Gtk.SearchEntry already coalesces keystroke bursts into one
+        # search-changed; also skip edits (and tab switches) that leave the
+        # effective query unchanged - every filter already reflects it
+        filter_text = entry.get_text().strip().casefold()
+        if filter_text == self.filter_text:
+            return
+        # A row that missed the old query also misses any extension of it,
+        # and a row that matched it also matches any prefix of it (backspace);
+        # keep whichever verdicts still hold, else start over
+        narrowing = bool(self.filter_text) and filter_text.startswith(self.filter_text)
+        widening = bool(filter_text) and self.filter_text.startswith(filter_text)
+        if not narrowing:
+            self._filter_misses = set()
+        if not widening:
+            self._filter_hits = set()
+        self.filter_text = filter_text
+        # Multi-word queries match rows containing every word, in any order;
+        # a single word keeps the plain substring test
+        tokens = tuple(filter_text.split())
+        self._filter_tokens = tokens if len(tokens) > 1 else None
+        # Only the visible script tab is refiltered now; the others are
+        # marked stale and caught up by on_tab_switched when shown
+        script_filters = [getattr(self, f'{tab}_filter') for tab in MAIN_TABS
+                          if hasattr(self, f'{tab}_filter')]
         if hasattr(self, 'dynamic_categories'):
             for category in self.dynamic_categories.keys():
                 filter_attr = f'{category}_filter'
                 if hasattr(self, filter_attr):
-                    getattr(self, filter_attr).refilter()
-        # Filter dynamic category tabs
+                    script_filters.append(getattr(self, filter_attr))
         if hasattr(self, 'dynamic_filters'):
-            for filter_model in self.dynamic_filters.values():
+            script_filters.extend(self.dynamic_filters.values())
+        current_filter = getattr(self, f'{self.current_tab}_filter', None)
+        self._stale_filters = {f for f in script_filters if f is not current_filter}
+        # Narrowing a query that already hides every row cannot reveal any,
+        # so skip the per-row visible-func callbacks entirely
+        if current_filter is not None and not (narrowing and current_filter.iter_n_children(None) == 0):
+            current_filter.refilter()
+        # Repository views are likewise refiltered only while on screen
+        page_num = self.notebook.get_current_page()
+        current_page = self.notebook.get_nth_page(page_num) if page_num >= 0 else None
+        for filter_model, tree in self._repo_filter_views():
+            if current_page is not None and tree.is_ancestor(current_page):
+                filter_model.refilter()
+            else:
+                self._stale_filters.add(filter_model)
+
+    def _repo_filter_views(self):
+        """(filter model, tree view) pairs for the repository tabs that exist"""
+        views = []
+        if hasattr(self, 'repo_filter'):
+            views.append((self.repo_filter, self.repo_tree))
+        if hasattr(self, 'local_repo_filter'):
+            views.append((self.local_repo_filter, self.local_repo_tree))
+        return views
+
+    def _catch_up_repo_filters(self, page):
+        """Refilter any stale repository view shown on the given notebook page"""
+        for filter_model, tree in self._repo_filter_views():
+            if filter_model in self._stale_filters and tree.is_ancestor(page):
+                self._stale_filters.discard(filter_model)
                 filter_model.refilter()
 
     def command_exists(self, cmd):
-        from shutil import which
-        return which(cmd) is not None
+        return _command_exists(cmd)
 
     def show_install_prompt(self, missing_pkgs):
         """Prompt user to install missing required packages"""
@@ -3461,8 +3924,7 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
                     if remote_checksum and manifest_has_verification:
                         import hashlib
                         try:
-                            with open(cached_path, 'rb') as f:
-                                local_checksum = hashlib.sha256(f.read()).hexdigest()
+                            local_checksum = hashlib.sha256(Path(cached_path).read_bytes()).hexdigest()
                             if local_checksum == remote_checksum:
                                 status_text = '✓ Cached'
                             else:
@@ -4315,6 +4777,7 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
             UNINSTALL_SCRIPTS[:] = _scripts.get('uninstall', [])
             UNINSTALL_NAMES[:] = _names.get('uninstall', [])
             UNINSTALL_DESCRIPTIONS[:] = _descriptions.get('uninstall', [])
+            _sync_script_basenames()
             
             # Clear and recreate dynamic tabs with fresh data using TabManager
             if hasattr(self, 'tab_manager') and self.repository:
@@ -4361,6 +4824,7 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
             UNINSTALL_SCRIPTS[:] = _scripts.get('uninstall', [])
             UNINSTALL_NAMES[:] = _names.get('uninstall', [])
             UNINSTALL_DESCRIPTIONS[:] = _descriptions.get('uninstall', [])
+            _sync_script_basenames()
             
             # Clear and recreate dynamic tabs with fresh data using TabManager (silently)
             if hasattr(self, 'tab_manager') and self.repository:
@@ -4644,8 +5108,11 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
                 text="Script Not Found"
             )
             dialog.format_secondary_text(f"The script file does not exist:\n{script_path}")
-            dialog.run()
-            dialog.destroy()
+            if UI:
+                UI.present_and_forget(dialog)
+            else:
+                dialog.run()
+                dialog.destroy()
             return
         
         # Execute directly
@@ -5144,6 +5611,7 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
                 UNINSTALL_NAMES.extend(new_uninstall_names)
                 UNINSTALL_DESCRIPTIONS.clear()
                 UNINSTALL_DESCRIPTIONS.extend(new_uninstall_desc)
+                _sync_script_basenames()
                 
                 # Verify update succeeded
                 total_scripts = len(SCRIPTS) + len(TOOLS_SCRIPTS) + len(EXERCISES_SCRIPTS) + len(UNINSTALL_SCRIPTS)
@@ -5162,16 +5630,6 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
                 if hasattr(self, 'local_repo_store'):
                     self._populate_local_repository_tree()
                 
-                # Force UI refresh by refiltering
-                if hasattr(self, 'install_filter'):
-                    self.install_filter.refilter()
-                if hasattr(self, 'tools_filter'):
-                    self.tools_filter.refilter()
-                if hasattr(self, 'exercises_filter'):
-                    self.exercises_filter.refilter()
-                if hasattr(self, 'uninstall_filter'):
-                    self.uninstall_filter.refilter()
-                
                 self.terminal.feed(b"\x1b[32m[OK] UI refreshed successfully\x1b[0m\r\n\r\n")
                 
                 # Complete the terminal operation after a brief delay to allow GTK to process
@@ -5186,18 +5644,29 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
     
     def _refresh_script_tabs(self):
         """Refresh all script tab liststores with updated data"""
+        # Detach the main treeviews while their stores are rebuilt so each
+        # re-measures once on reattach instead of on every row-inserted
+        detached = []
+        for tab_name in MAIN_TABS:
+            treeview = getattr(self, f'{tab_name}_treeview', None)
+            if treeview is not None:
+                detached.append((treeview, treeview.get_model()))
+                treeview.set_model(None)
         try:
             # CRITICAL: Clear dynamic tabs before refreshing using TabManager
             if hasattr(self, 'tab_manager'):
                 self.tab_manager.clear_dynamic_tabs()
             
-            # Refresh Install tab
-            if hasattr(self, 'install_liststore'):
-                self.terminal.feed(f"\x1b[36m  - Install tab: {len(SCRIPTS)} scripts\x1b[0m\r\n".encode())
-                self.install_liststore.clear()
-                for i, script_path in enumerate(SCRIPTS):
-                    if i < len(SCRIPT_NAMES) and i < len(DESCRIPTIONS):
-                        metadata = self._build_script_metadata(script_path, 'install', SCRIPT_NAMES[i])
+            # Refresh each built main tab from its TAB_DATA arrays
+            for tab_name, (scripts, names, descriptions, basenames) in TAB_DATA.items():
+                liststore = getattr(self, f'{tab_name}_liststore', None)
+                if liststore is None:
+                    continue
+                self.terminal.feed(f"\x1b[36m  - {tab_name.capitalize()} tab: {len(scripts)} scripts\x1b[0m\r\n".encode())
+                liststore.clear()
+                for i, script_path in enumerate(scripts):
+                    if i < len(names) and i < len(descriptions):
+                        metadata = self._build_script_metadata(script_path, tab_name, names[i])
                         script_id = metadata.get('script_id', '')
                         source_type = metadata.get('source_type', '')
                         
@@ -5206,7 +5675,7 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
                             icon = "📄"
                             is_cached = False
                         else:
-                            is_cached = self._is_script_cached(script_id=script_id, script_path=script_path, category='install')
+                            is_cached = self._is_script_cached(script_id=script_id, script_path=script_path, category=tab_name)
                             icon = "\u2713" if is_cached else "\u2601\ufe0f"
                         
                         path_to_store = script_path
@@ -5216,120 +5685,20 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
                                 cached_path = self.repository.get_cached_script_path(script_id)
                             else:
                                 # Fallback: resolve by category + filename when script_id is missing
-                                filename = os.path.basename(script_path)
-                                cached_path = self.repository.get_cached_script_path(category='install', filename=filename)
-                            if cached_path and os.path.exists(cached_path):
-                                path_to_store = cached_path
-                                metadata["type"] = "cached"
-                                metadata["file_exists"] = True
-                                pass  # removed debug log
-                        
-                        self.install_liststore.append([icon, SCRIPT_NAMES[i], path_to_store, DESCRIPTIONS[i], False, json.dumps(metadata), script_id])
-            
-            # Refresh Tools tab
-            if hasattr(self, 'tools_liststore'):
-                self.terminal.feed(f"\x1b[36m  - Tools tab: {len(TOOLS_SCRIPTS)} scripts\x1b[0m\r\n".encode())
-                self.tools_liststore.clear()
-                for i, script_path in enumerate(TOOLS_SCRIPTS):
-                    if i < len(TOOLS_NAMES) and i < len(TOOLS_DESCRIPTIONS):
-                        metadata = self._build_script_metadata(script_path, 'tools', TOOLS_NAMES[i])
-                        script_id = metadata.get('script_id', '')
-                        source_type = metadata.get('source_type', '')
-                        
-                        # Local scripts don't use cache
-                        if source_type == 'custom_local':
-                            icon = "📄"
-                            is_cached = False
-                        else:
-                            is_cached = self._is_script_cached(script_id=script_id, script_path=script_path, category='tools')
-                            icon = "\u2713" if is_cached else "\u2601\ufe0f"
-                        
-                        path_to_store = script_path
-                        if is_cached and self.repository:
-                            cached_path = None
-                            if script_id:
-                                cached_path = self.repository.get_cached_script_path(script_id)
-                            else:
-                                filename = os.path.basename(script_path)
-                                cached_path = self.repository.get_cached_script_path(category='tools', filename=filename)
-                            if cached_path and os.path.exists(cached_path):
-                                path_to_store = cached_path
-                                metadata["type"] = "cached"
-                                metadata["file_exists"] = True
-                                pass  # removed debug log
-                        
-                        self.tools_liststore.append([icon, TOOLS_NAMES[i], path_to_store, TOOLS_DESCRIPTIONS[i], False, json.dumps(metadata), script_id])
-            
-            # Refresh Exercises tab
-            if hasattr(self, 'exercises_liststore'):
-                self.terminal.feed(f"\x1b[36m  - Exercises tab: {len(EXERCISES_SCRIPTS)} scripts\x1b[0m\r\n".encode())
-                self.exercises_liststore.clear()
-                for i, script_path in enumerate(EXERCISES_SCRIPTS):
-                    if i < len(EXERCISES_NAMES) and i < len(EXERCISES_DESCRIPTIONS):
-                        metadata = self._build_script_metadata(script_path, 'exercises', EXERCISES_NAMES[i])
-                        script_id = metadata.get('script_id', '')
-                        source_type = metadata.get('source_type', '')
-                        
-                        # Local scripts don't use cache
-                        if source_type == 'custom_local':
-                            icon = "📄"
-                            is_cached = False
-                        else:
-                            is_cached = self._is_script_cached(script_id=script_id, script_path=script_path, category='exercises')
-                            icon = "\u2713" if is_cached else "\u2601\ufe0f"
-                        
-                        path_to_store = script_path
-                        if is_cached and self.repository:
-                            cached_path = None
-                            if script_id:
-                                cached_path = self.repository.get_cached_script_path(script_id)
-                            else:
-                                filename = os.path.basename(script_path)
-                                cached_path = self.repository.get_cached_script_path(category='exercises', filename=filename)
+                                filename = basenames[i] if i < len(basenames) else os.path.basename(script_path)
+                                cached_path = self.repository.get_cached_script_path(category=tab_name, filename=filename)
                             if cached_path and os.path.exists(cached_path):
                                 path_to_store = cached_path
                                 metadata["type"] = "cached"
                                 metadata["file_exists"] = True
-                                pass  # removed debug log
-                        
-                        self.exercises_liststore.append([icon, EXERCISES_NAMES[i], path_to_store, EXERCISES_DESCRIPTIONS[i], False, json.dumps(metadata), script_id])
-            
-            # Refresh Uninstall tab
-            if hasattr(self, 'uninstall_liststore'):
-                self.terminal.feed(f"\x1b[36m  - Uninstall tab: {len(UNINSTALL_SCRIPTS)} scripts\x1b[0m\r\n".encode())
-                self.uninstall_liststore.clear()
-                for i, script_path in enumerate(UNINSTALL_SCRIPTS):
-                    if i < len(UNINSTALL_NAMES) and i < len(UNINSTALL_DESCRIPTIONS):
-                        metadata = self._build_script_metadata(script_path, 'uninstall', UNINSTALL_NAMES[i])
-                        script_id = metadata.get('script_id', '')
-                        source_type = metadata.get('source_type', '')
                         
-                        # Local scripts don't use cache
-                        if source_type == 'custom_local':
-                            icon = "📄"
-                            is_cached = False
-                        else:
-                            is_cached = self._is_script_cached(script_id=script_id, script_path=script_path, category='uninstall')
-                            icon = "\u2713" if is_cached else "\u2601\ufe0f"
-                        
-                        path_to_store = script_path
-                        if is_cached and self.repository:
-                            cached_path = None
-                            if script_id:
-                                cached_path = self.repository.get_cached_script_path(script_id)
-                            else:
-                                filename = os.path.basename(script_path)
-                                cached_path = self.repository.get_cached_script_path(category='uninstall', filename=filename)
-                            if cached_path and os.path.exists(cached_path):
-                                path_to_store = cached_path
-                                metadata["type"] = "cached"
-                                metadata["file_exists"] = True
-                                pass  # removed debug log
-                        
-                        self.uninstall_liststore.append([icon, UNINSTALL_NAMES[i], path_to_store, UNINSTALL_DESCRIPTIONS[i], False, json.dumps(metadata), script_id])
+                        liststore.insert_with_valuesv(-1, _SCRIPT_ROW_COLUMNS, [icon, names[i], path_to_store, descriptions[i], False, json.dumps(metadata), script_id, _search_key(names[i], path_to_store)])
             
         except Exception as e:
             self.terminal.feed(f"[!] Error refreshing tabs: {e}\r\n".encode())
+        finally:
+            for treeview, model in detached:
+                treeview.set_model(model)
 
     
     def _update_repo_status(self):
@@ -5780,202 +6149,96 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
         Uses global manifest data (SCRIPTS, TOOLS_SCRIPTS, etc.)
         """
         try:
-            # Clear and repopulate install tab
-            if hasattr(self, 'install_liststore'):
-                self.install_liststore.clear()
-                for i, script_path in enumerate(SCRIPTS):
-                    if i < len(SCRIPT_NAMES) and i < len(DESCRIPTIONS):
-                        metadata = self._build_script_metadata(script_path, "install", SCRIPT_NAMES[i])
-                        script_id = metadata.get('script_id', '')
-                        is_cached = self._is_script_cached(script_id=script_id, script_path=script_path, category="install")
-                        
-                        # Check for updates if cached
-                        has_update = False
-                        if is_cached and self.repository and script_id:
-                            script_info = self.repository.get_script_by_id(script_id)
-                            if script_info:
-                                remote_checksum = script_info.get('checksum', '').replace('sha256:', '')
-                                cached_path = self.repository.get_cached_script_path(script_id)
-                                if cached_path and os.path.exists(cached_path) and remote_checksum:
-                                    import hashlib
-                                    try:
-                                        with open(cached_path, 'rb') as f:
-                                            local_checksum = hashlib.sha256(f.read()).hexdigest()
-                                        has_update = local_checksum != remote_checksum
-                                    except:
-                                        pass
-                        
-                        icon = "📥" if has_update else ("✓" if is_cached else "☁️")
-                        
-                        # Prefer cached full path when available
-                        path_to_store = script_path
-                        if is_cached and self.repository:
-                            cached_path = None
-                            if script_id:
-                                cached_path = self.repository.get_cached_script_path(script_id)
-                            else:
-                                filename = os.path.basename(script_path)
-                                cached_path = self.repository.get_cached_script_path(category="install", filename=filename)
-                            if cached_path and os.path.exists(cached_path):
-                                path_to_store = cached_path
-                                metadata["type"] = "cached"
-                                metadata["file_exists"] = True
-                        self.install_liststore.append([icon, SCRIPT_NAMES[i], path_to_store, DESCRIPTIONS[i], False, json.dumps(metadata), script_id])
-            
-            # Clear and repopulate tools tab  
-            if hasattr(self, 'tools_liststore'):
-                self.tools_liststore.clear()
-                for i, script_path in enumerate(TOOLS_SCRIPTS):
-                    if i < len(TOOLS_NAMES) and i < len(TOOLS_DESCRIPTIONS):
-                        metadata = self._build_script_metadata(script_path, "tools", TOOLS_NAMES[i])
-                        script_id = metadata.get('script_id', '')
-                        is_cached = self._is_script_cached(script_id=script_id, script_path=script_path, category="tools")
-                        
-                        # Check for updates if cached
-                        has_update = False
-                        if is_cached and self.repository and script_id:
-                            script_info = self.repository.get_script_by_id(script_id)
-                            if script_info:
-                                remote_checksum = script_info.get('checksum', '').replace('sha256:', '')
-                                cached_path = self.repository.get_cached_script_path(script_id)
-                                if cached_path and os.path.exists(cached_path) and remote_checksum:
-                                    import hashlib
-                                    try:
-                                        with open(cached_path, 'rb') as f:
-                                            local_checksum = hashlib.sha256(f.read()).hexdigest()
-                                        has_update = local_checksum != remote_checksum
-                                    except:
-                                        pass
-                        
-                        icon = "📥" if has_update else ("✓" if is_cached else "☁️")
-                        
-                        path_to_store = script_path
-                        if is_cached and self.repository:
-                            cached_path = None
-                            if script_id:
-                                cached_path = self.repository.get_cached_script_path(script_id)
-                            else:
-                                filename = os.path.basename(script_path)
-                                cached_path = self.repository.get_cached_script_path(category="tools", filename=filename)
-                            if cached_path and os.path.exists(cached_path):
-                                path_to_store = cached_path
-                                metadata["type"] = "cached"
-                                metadata["file_exists"] = True
-                        self.tools_liststore.append([icon, TOOLS_NAMES[i], path_to_store, TOOLS_DESCRIPTIONS[i], False, json.dumps(metadata), script_id])
-            
-            # Clear and repopulate exercises tab
-            if hasattr(self, 'exercises_liststore'):
-                self.exercises_liststore.clear()
-                for i, script_path in enumerate(EXERCISES_SCRIPTS):
-                    if i < len(EXERCISES_NAMES) and i < len(EXERCISES_DESCRIPTIONS):
-                        metadata = self._build_script_metadata(script_path, "exercises", EXERCISES_NAMES[i])
-                        script_id = metadata.get('script_id', '')
-                        is_cached = self._is_script_cached(script_id=script_id, script_path=script_path, category="exercises")
-                        
-                        # Check for updates if cached
-                        has_update = False
-                        if is_cached and self.repository and script_id:
-                            script_info = self.repository.get_script_by_id(script_id)
-                            if script_info:
-                                remote_checksum = script_info.get('checksum', '').replace('sha256:', '')
-                                cached_path = self.repository.get_cached_script_path(script_id)
-                                if cached_path and os.path.exists(cached_path) and remote_checksum:
-                                    import hashlib
-                                    try:
-                                        with open(cached_path, 'rb') as f:
-                                            local_checksum = hashlib.sha256(f.read()).hexdigest()
-                                        has_update = local_checksum != remote_checksum
-                                    except:
-                                        pass
-                        
-                        icon = "📥" if has_update else ("✓" if is_cached else "☁️")
-                        
-                        path_to_store = script_path
-                        if is_cached and self.repository:
-                            cached_path = None
-                            if script_id:
-                                cached_path = self.repository.get_cached_script_path(script_id)
-                            else:
-                                filename = os.path.basename(script_path)
-                                cached_path = self.repository.get_cached_script_path(category="exercises", filename=filename)
-                            if cached_path and os.path.exists(cached_path):
-                                path_to_store = cached_path
-                                metadata["type"] = "cached"
-                                metadata["file_exists"] = True
-                        self.exercises_liststore.append([icon, EXERCISES_NAMES[i], path_to_store, EXERCISES_DESCRIPTIONS[i], False, json.dumps(metadata), script_id])
-            
-            # Clear and repopulate uninstall tab
-            if hasattr(self, 'uninstall_liststore'):
-                self.uninstall_liststore.clear()
-                for i, script_path in enumerate(UNINSTALL_SCRIPTS):
-                    if i < len(UNINSTALL_NAMES) and i < len(UNINSTALL_DESCRIPTIONS):
-                        metadata = self._build_script_metadata(script_path, "uninstall", UNINSTALL_NAMES[i])
-                        script_id = metadata.get('script_id', '')
-                        is_cached = self._is_script_cached(script_id=script_id, script_path=script_path, category="uninstall")
-                        
-                        # Check for updates if cached
-                        has_update = False
-                        if is_cached and self.repository and script_id:
-                            script_info = self.repository.get_script_by_id(script_id)
-                            if script_info:
-                                remote_checksum = script_info.get('checksum', '').replace('sha256:', '')
-                                cached_path = self.repository.get_cached_script_path(script_id)
-                                if cached_path and os.path.exists(cached_path) and remote_checksum:
-                                    import hashlib
-                                    try:
-                                        with open(cached_path, 'rb') as f:
-                                            local_checksum = hashlib.sha256(f.read()).hexdigest()
-                                        has_update = local_checksum != remote_checksum
-                                    except:
-                                        pass
-                        
-                        icon = "📥" if has_update else ("✓" if is_cached else "☁️")
-                        
-                        path_to_store = script_path
-                        if is_cached and self.repository:
-                            cached_path = None
-                            if script_id:
-                                cached_path = self.repository.get_cached_script_path(script_id)
-                            else:
-                                filename = os.path.basename(script_path)
-                                cached_path = self.repository.get_cached_script_path(category="uninstall", filename=filename)
-                            if cached_path and os.path.exists(cached_path):
-                                path_to_store = cached_path
-                                metadata["type"] = "cached"
-                                metadata["file_exists"] = True
-                        self.uninstall_liststore.append([icon, UNINSTALL_NAMES[i], path_to_store, UNINSTALL_DESCRIPTIONS[i], False, json.dumps(metadata), script_id])
-                        
+            for tab_name, tab_data in TAB_DATA.items():
+                self._repopulate_category_store(tab_name, *tab_data)
         except Exception as e:
             print(f"Error repopulating tab stores: {e}")
 
+    def _repopulate_category_store(self, category, scripts, names, descriptions, basenames):
+        """
+        Clear and refill a single main tab liststore.
+        The treeview is detached from its model while rows are inserted so it
+        re-measures once instead of once per row-inserted signal.
+        """
+        liststore = getattr(self, f'{category}_liststore', None)
+        if liststore is None:
+            return
+        treeview = getattr(self, f'{category}_treeview', None)
+        filter_model = getattr(self, f'{category}_filter', None)
+        
+        if treeview is not None:
+            treeview.freeze_child_notify()
+            treeview.set_model(None)
+        try:
+            liststore.clear()
+            for i, script_path in enumerate(scripts):
+                if i < len(names) and i < len(descriptions):
+                    metadata = self._build_script_metadata(script_path, category, names[i])
+                    script_id = metadata.get('script_id', '')
+                    is_cached = self._is_script_cached(script_id=script_id, script_path=script_path, category=category)
+                    
+                    # Check for updates if cached
+                    has_update = False
+                    if is_cached and self.repository and script_id:
+                        script_info = self.repository.get_script_by_id(script_id)
+                        if script_info:
+                            remote_checksum = script_info.get('checksum', '').replace('sha256:', '')
+                            cached_path = self.repository.get_cached_script_path(script_id)
+                            if cached_path and os.path.exists(cached_path) and remote_checksum:
+                                try:
+                                    local_checksum = hashlib.sha256(Path(cached_path).read_bytes()).hexdigest()
+                                    has_update = local_checksum != remote_checksum
+                                except:
+                                    pass
+                    
+                    icon = "📥" if has_update else ("✓" if is_cached else "☁️")
+                    
+                    # Prefer cached full path when available
+                    path_to_store = script_path
+                    if is_cached and self.repository:
+                        cached_path = None
+                        if script_id:
+                            cached_path = self.repository.get_cached_script_path(script_id)
+                        else:
+                            filename = basenames[i] if i < len(basenames) else os.path.basename(script_path)
+                            cached_path = self.repository.get_cached_script_path(category=category, filename=filename)
+                        if cached_path and os.path.exists(cached_path):
+                            path_to_store = cached_path
+                            metadata["type"] = "cached"
+                            metadata["file_exists"] = True
+                    liststore.insert_with_valuesv(-1, _SCRIPT_ROW_COLUMNS, [icon, names[i], path_to_store, descriptions[i], False, json.dumps(metadata), script_id, _search_key(names[i], path_to_store)])
+        finally:
+            if treeview is not None:
+                treeview.set_model(filter_model)
+                treeview.thaw_child_notify()
+
     # ========================================================================
     # PACKAGE INSTALLATION HELPERS
     # ========================================================================
 
     def install_packages_in_terminal(self, pkgs, required=True):
         """Install packages by running commands in the embedded terminal"""
-        pkg_list = " ".join(pkgs)
+        pkg_list = " ".join(shlex.quote(pkg) for pkg in pkgs)
         pkg_type = "required" if required else "optional"
         
-        # Clear screen first
-        self.terminal.feed_child(b"clear\n")
-        
-        # Just run the installation command
-        install_cmd = f"sudo apt-get update && sudo apt-get install -y {pkg_list}\n"
+        # Clear the screen and install every package with one apt-get
+        # invocation, sent to the shell in a single PTY write; apt's output
+        # streams straight into the terminal rather than through a pipe
+        install_cmd = f"clear; sudo apt-get update && sudo apt-get install -y {pkg_list}\n"
         self.terminal.feed_child(install_cmd.encode())
         
         # Show info dialog with option to restart when done
-        GLib.idle_add(self._show_install_started_dialog, pkg_type, pkg_list, required)
+        GLib.idle_add(self._show_install_started_dialog, pkg_type, list(pkgs), required)
     
     def _send_install_commands(self, pkg_list, pkg_type):
         """Send installation commands to terminal after clearing"""
         # This method is no longer used but kept to avoid breaking references
         pass
     
-    def _show_install_started_dialog(self, pkg_type, pkg_list, required=True):
+    def _show_install_started_dialog(self, pkg_type, pkgs, required=True):
         """Show dialog that installation has started - uses UI helper"""
         if UI:
-            UI.show_install_started_dialog(self, pkg_type, pkg_list.split(', '), required)
+            UI.show_install_started_dialog(self, pkg_type, pkgs, required)
         # No fallback needed - non-critical dialog
         return False
     
@@ -6000,35 +6263,59 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
     # EVENT HANDLERS - USER INTERACTIONS
     # ========================================================================
 
-    def on_selection_changed(self, selection):
+    def on_selection_changed(self, selection, widgets=None):
         model, treeiter = selection.get_selected()
-        widgets = self.get_current_widgets()
+        if widgets is None:
+            widgets = self.get_current_widgets()
         
         if treeiter is not None:
-            # model is filtered -> get data from model columns
+            # model is filtered -> get data from model columns in a single call
             # Column 0 is icon, 1 is name, 2 is path, 3 is description
-            basename = model[treeiter][1]
-            fullpath = model[treeiter][2]
-            desc_markup_raw = model[treeiter][3]
-            
-            # Build a compact header: bold filename + monospaced path, then description.
-            safe_name = GLib.markup_escape_text(basename)
-            safe_path = GLib.markup_escape_text(fullpath)
-            desc_markup = (
-                f"<big><b>{safe_name}</b></big>\n"
-                f"<tt>{safe_path}</tt>\n\n"
-                f"{desc_markup_raw}"
+            basename, fullpath, desc_markup_raw = model.get(
+                treeiter,
+                C.COL_NAME if C else 1,
+                C.COL_PATH if C else 2,
+                C.COL_DESCRIPTION if C else 3
             )
-            widgets['description_label'].set_markup(desc_markup)
+            
+            description_label = widgets['description_label']
+            desc_markup = _description_markup(basename, fullpath, desc_markup_raw)
+            # Same row re-selected with nothing queued: the pane and buttons
+            # already reflect it
+            if (self._shown_desc_markup.get(description_label) is desc_markup
+                    and description_label not in self._pending_desc_markup):
+                return
+
+            # Markup is applied from an idle callback so holding an arrow key
+            # lays out only the row the cursor settles on, not every row passed
+            self._pending_desc_markup[description_label] = desc_markup
+            if self._desc_idle_id is None:
+                self._desc_idle_id = GLib.idle_add(self._apply_pending_descriptions)
             widgets['run_button'].set_sensitive(True)
             widgets['view_button'].set_sensitive(True)
             widgets['cd_button'].set_sensitive(True)
         else:
-            widgets['description_label'].set_text("Select a script to see description.")
+            # The view may be showing a shared buffer, so swap rather than edit it
+            _set_description_markup(widgets['description_label'], _DESC_PLACEHOLDER)
+            self._shown_desc_markup.pop(widgets['description_label'], None)
+            self._pending_desc_markup.pop(widgets['description_label'], None)
             widgets['run_button'].set_sensitive(False)
             widgets['view_button'].set_sensitive(False)
             widgets['cd_button'].set_sensitive(False)
 
+    def _apply_pending_descriptions(self):
+        """Push the latest queued description markup to each label (idle callback)"""
+        self._desc_idle_id = None
+        pending, self._pending_desc_markup = self._pending_desc_markup, {}
+        for description_label, desc_markup in pending.items():
+            # Re-selecting the same row must not re-run the Pango markup parser.
+            # Compare by identity against what we last pushed, rather than
+            # marshalling the label text back out of GTK on every selection.
+            if self._shown_desc_markup.get(description_label) is not desc_markup:
+                _set_description_markup(description_label, desc_markup)
+                self._shown_desc_markup[description_label] = desc_markup
+        return False
+
     def on_run_clicked(self, button):
         """Handle Run button - delegates to ScriptActionHandler for unified execution"""
         script_path, metadata = self._get_selected_script_data()
@@ -6067,7 +6354,7 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
         else:
             # Fallback: basic view if handler not initialized
             if os.path.isfile(script_path):
-                self.terminal.feed_child(f"cat {shlex.quote(script_path)}\n".encode())
+                self.terminal.feed_child(b"cat " + os.fsencode(shlex.quote(script_path)) + b"\n")
     
     def _get_selected_script_data(self):
         """
@@ -6081,25 +6368,21 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
         current_page = self.notebook.get_current_page()
         current_page_widget = self.notebook.get_nth_page(current_page)
         
-        # Helper to find widget in container tree
-        def find_widget(container, target):
-            if container == target:
-                return True
-            if isinstance(container, Gtk.Container):
-                for child in container.get_children():
-                    if find_widget(child, target):
-                        return True
-            return False
+        # Helper to test whether a widget lives on the current page; walks
+        # up the parent chain in C instead of recursing over every child
+        def on_page(page, target):
+            return target is page or target.is_ancestor(page)
         
         # Detect which tab type we're on
         is_local_repo_tab = False
         is_repository_tab = False
         
-        if hasattr(self, 'local_repo_tree'):
-            is_local_repo_tab = find_widget(current_page_widget, self.local_repo_tree)
-        
-        if hasattr(self, 'repo_tree') and not is_local_repo_tab:
-            is_repository_tab = find_widget(current_page_widget, self.repo_tree)
+        if current_page_widget is not None:
+            if hasattr(self, 'local_repo_tree'):
+                is_local_repo_tab = on_page(current_page_widget, self.local_repo_tree)
+            
+            if hasattr(self, 'repo_tree') and not is_local_repo_tab:
+                is_repository_tab = on_page(current_page_widget, self.repo_tree)
         
         # Get selection based on which tab we're on
         if is_local_repo_tab:
@@ -6130,10 +6413,7 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
         elif is_repository_tab:
             # REPOSITORY TAB: Cache engine, script_id at column 1
             # Columns: 0=selected, 1=id, 2=name, 3=version, 4=status, 5=category, 6=size, 7=modified, 8=source
-            script_id = model[treeiter][1]
-            display_name = model[treeiter][2]
-            category = model[treeiter][5]
-            source_name = model[treeiter][8]
+            script_id, display_name, category, source_name = model.get(treeiter, 1, 2, 5, 8)
             
             # Build metadata for repository script
             metadata = {
@@ -6149,8 +6429,7 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
         else:
             # STANDARD/DYNAMIC TABS: Script tabs (install, tools, exercises, uninstall, custom, etc.)
             # Columns: 0=icon, 1=name, 2=path, 3=description, 4=is_custom, 5=metadata, 6=script_id
-            script_path = model[treeiter][C.COL_PATH if C else 2]
-            display_name = model[treeiter][C.COL_NAME if C else 1]
+            script_path, display_name = model.get(treeiter, C.COL_PATH if C else 2, C.COL_NAME if C else 1)
             metadata = self._get_script_metadata(model, treeiter)
             
             # Build metadata if missing
@@ -6162,42 +6441,52 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
     
     def on_terminal_clear(self, button):
         """Clear the terminal"""
-        self.terminal.feed_child(b"clear\n")
+        # Clear in-process and let readline redraw the prompt (Ctrl-L)
+        # rather than typing 'clear', which forks /usr/bin/clear each time
+        self.terminal.reset(True, True)
+        self.terminal.feed_child(b"\x0c")
     
     def on_terminal_button_press(self, widget, event):
         """Handle right-click on terminal to show context menu"""
         if event.button == 3:  # Right-click
-            menu = Gtk.Menu()
-            
-            # Copy menu item
-            copy_item = Gtk.MenuItem(label="Copy")
-            copy_item.connect("activate", self.on_terminal_copy)
-            menu.append(copy_item)
-            
-            # Paste menu item
-            paste_item = Gtk.MenuItem(label="Paste")
-            paste_item.connect("activate", self.on_terminal_paste)
-            menu.append(paste_item)
-            
-            menu.append(Gtk.SeparatorMenuItem())
-            
-            # Select All menu item
-            select_all_item = Gtk.MenuItem(label="Select All")
-            select_all_item.connect("activate", self.on_terminal_select_all)
-            menu.append(select_all_item)
-            
-            menu.append(Gtk.SeparatorMenuItem())
-            
-            # Clear menu item
-            clear_item = Gtk.MenuItem(label="Clear")
-            clear_item.connect("activate", lambda w: self.terminal.feed_child(b"clear\n"))
-            menu.append(clear_item)
-            
-            menu.show_all()
-            menu.popup_at_pointer(event)
+            if self._terminal_menu is None:
+                self._terminal_menu = self._build_terminal_menu()
+            self._terminal_menu.popup_at_pointer(event)
             return True
         return False
     
+    def _build_terminal_menu(self):
+        """Create the terminal context menu once; every right-click reuses it"""
+        menu = Gtk.Menu()
+        menu.attach_to_widget(self.terminal, None)
+        
+        # Copy menu item
+        copy_item = Gtk.MenuItem(label="Copy")
+        copy_item.connect("activate", self.on_terminal_copy)
+        menu.append(copy_item)
+        
+        # Paste menu item
+        paste_item = Gtk.MenuItem(label="Paste")
+        paste_item.connect("activate", self.on_terminal_paste)
+        menu.append(paste_item)
+        
+        menu.append(Gtk.SeparatorMenuItem())
+        
+        # Select All menu item
+        select_all_item = Gtk.MenuItem(label="Select All")
+        select_all_item.connect("activate", self.on_terminal_select_all)
+        menu.append(select_all_item)
+        
+        menu.append(Gtk.SeparatorMenuItem())
+        
+        # Clear menu item
+        clear_item = Gtk.MenuItem(label="Clear")
+        clear_item.connect("activate", self.on_terminal_clear)
+        menu.append(clear_item)
+        
+        menu.show_all()
+        return menu
+    
     def on_terminal_copy(self, menu_item):
         """Copy selected text from terminal to clipboard"""
         self.terminal.copy_clipboard_format(Vte.Format.TEXT)
@@ -6217,10 +6506,6 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
             adj.set_value(adj.get_lower())
         return False  # Don't repeat the timeout
 
-    def on_link_clicked(self, label, uri):
-        webbrowser.open(uri)
-        return True
-
     def on_row_activated(self, tree_view, path, column):
         # emulate run on double-click or Enter
         sel = tree_view.get_selection()
@@ -6352,15 +6637,11 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
     
     def _refresh_tab(self, category):
         """Refresh the script list for a specific tab"""
-        # Get the appropriate liststore
-        if category == "install":
-            liststore = self.install_liststore
-        elif category == "tools":
-            liststore = self.tools_liststore
-        elif category == "exercises":
-            liststore = self.exercises_liststore
-        else:
-            liststore = self.uninstall_liststore
+        # Get the appropriate liststore (anything unrecognised maps to uninstall)
+        tab_name = category if category in TAB_DATA else "uninstall"
+        liststore = getattr(self, f'{tab_name}_liststore', None)
+        if liststore is None:
+            return  # tab not built yet; it will load current data when shown
         
         # Clear existing custom scripts (keep only built-in)
         iter = liststore.get_iter_first()
@@ -6622,7 +6903,8 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
         try:
             # Debug: Show what we're passing
             if manifest_path:
-                self.terminal.feed(f"\x1b[36m[DEBUG] Using custom manifest: {manifest_path}\x1b[0m\r\n".encode())
+                manifest_label = manifest_path.get('name', 'custom') if isinstance(manifest_path, dict) else manifest_path
+                self.terminal.feed(f"\x1b[36m[DEBUG] Using custom manifest: {manifest_label}\x1b[0m\r\n".encode())
             self.terminal.feed(f"\x1b[36m[DEBUG] Script ID: {script_id}\x1b[0m\r\n".encode())
             
             result = self.repository.download_script(script_id, manifest_path=manifest_path)
@@ -6804,6 +7086,7 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
             # Force refresh manifest and reload with repository configuration
             global _SCRIPT_ID_MAP
             _SCRIPTS_DICT, _NAMES_DICT, _DESCRIPTIONS_DICT, _SCRIPT_ID_MAP = load_scripts_from_manifest(self.terminal, self.repository)
+            self._shown_desc_markup.clear()
             
             # Update global arrays
             SCRIPTS[:] = _SCRIPTS_DICT.get('install', [])
@@ -6821,16 +7104,18 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
             UNINSTALL_SCRIPTS[:] = _SCRIPTS_DICT.get('uninstall', [])
             UNINSTALL_NAMES[:] = _NAMES_DICT.get('uninstall', [])
             UNINSTALL_DESCRIPTIONS[:] = _DESCRIPTIONS_DICT.get('uninstall', [])
+            _sync_script_basenames()
             
-            # Clear dynamic tabs and repopulate with fresh data
-            self._create_dynamic_category_tabs()
+            # Recreate dynamic tabs only when their categories/contents changed
+            if self.tab_manager.dynamic_category_signature() != self.tab_manager.category_signature:
+                self._create_dynamic_category_tabs()
             
             # Repopulate all tab stores
             self._repopulate_tab_stores()
             
             # Refresh UI
-            if hasattr(self, '_refresh_ui_silent'):
-                GLib.timeout_add(100, self._refresh_ui_silent)
+            if self._refresh_ui_silent_cb:
+                GLib.timeout_add(100, self._refresh_ui_silent_cb)
             
         except Exception as e:
             self.terminal.feed(f"\x1b[31m[✗] Error refreshing scripts: {e}\x1b[0m\r\n\r\n".encode())
@@ -6856,66 +7141,129 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
         print(f"[+] Auto-refresh scheduled: interval={interval_minutes} minute(s), timeout_id={self._auto_refresh_timeout_id}", flush=True)
 
     def _run_manifest_auto_refresh(self):
-        """Refresh manifest cache and update all tabs"""
+        """Refresh manifest cache in a background thread, then update all tabs"""
+        import threading
+
         if not self.repository or not refresh_manifest_cache:
             print("[!] Auto-refresh skipped: missing repository or refresh_manifest_cache")
             return True
+        if self._manifest_refresh_thread is not None and self._manifest_refresh_thread.is_alive():
+            print("[*] Auto-refresh skipped: previous refresh still running")
+            return True
+
+        def _fetch_worker():
+            # Network I/O only - UI updates are marshalled back via idle_add
+            try:
+                print("[*] Auto-refresh triggered - refreshing manifest cache...")
+                # Refresh manifest cache (public + custom manifests)
+                # Conditional GET: a 304 leaves the cached manifest untouched
+                refresh_manifest_cache(manifest_url=DEFAULT_MANIFEST_URL, terminal_callback=None, conditional=True)
+                print("[+] Manifest cache refreshed")
+            except Exception as e:
+                print(f"[!] Auto-refresh error: {e}", flush=True)
+                return
+            GLib.idle_add(self._apply_manifest_auto_refresh)
 
+        self._manifest_refresh_thread = threading.Thread(target=_fetch_worker, daemon=True)
+        self._manifest_refresh_thread.start()
+        return True
+
+    def _apply_manifest_auto_refresh(self):
+        """Reload script data on the main loop after a background manifest refresh"""
         try:
-            print("[*] Auto-refresh triggered - refreshing manifest cache...")
-            # Refresh manifest cache (public + custom manifests)
-            refresh_manifest_cache(manifest_url=DEFAULT_MANIFEST_URL, terminal_callback=None)
-            print("[+] Manifest cache refreshed")
-            
+            # Skip the expensive rebuild when the manifest is byte-identical
+            manifest_sha = self._manifest_cache_digest()
+            if manifest_sha and manifest_sha == self._last_manifest_sha:
+                print("[*] Manifest unchanged - skipping rebuild")
+                return False
+
             # Clear repository's internal manifest cache to force reload from disk
             if hasattr(self.repository, '_manifest_cache'):
                 self.repository._manifest_cache = None
             if hasattr(self.repository, '_scripts'):
                 self.repository._scripts = None
             print("[+] Repository cache cleared")
-            
+
             # Reload all script data and update UI
             self._refresh_all_script_data()
             print("[+] Script data reloaded")
 
             # Refresh repository tab/status if available
-            if hasattr(self, '_update_repo_status'):
-                self._update_repo_status()
-            if hasattr(self, '_populate_repository_tree'):
-                self._populate_repository_tree()
+            if self._update_repo_status_cb:
+                self._update_repo_status_cb()
+            if self._populate_repository_tree_cb:
+                self._populate_repository_tree_cb()
                 print("[+] Repository tree refreshed")
+
+            self._last_manifest_sha = manifest_sha
         except Exception as e:
             print(f"[!] Auto-refresh error: {e}", flush=True)
 
-        return True
+        return False
+
+    def _manifest_cache_digest(self):
+        """Return sha256 hex digest of the cached manifest, or None if unreadable"""
+        try:
+            return hashlib.sha256(Path(MANIFEST_CACHE_FILE).read_bytes()).hexdigest()
+        except OSError:
+            return None
     
     def _on_refresh_manifest_cache(self, widget=None):
+        """Schedule a manifest refresh, coalescing rapid repeated requests into one"""
+        if self._refresh_pending_id is not None:
+            return False
+        self._refresh_pending_id = GLib.timeout_add(250, self._do_refresh_once)
+        return False
+
+    def _do_refresh_once(self):
         """Clear manifest cache and fetch fresh from configured URL"""
+        import threading
+
+        self._refresh_pending_id = None
+        if self._manifest_refresh_thread is not None and self._manifest_refresh_thread.is_alive():
+            self.terminal.feed(b"\x1b[33m[*] Manifest refresh already in progress\x1b[0m\r\n")
+            return False
         self.terminal.feed(b"\x1b[36m[*] Clearing and rebuilding manifest cache...\x1b[0m\r\n")
-        
+
+        # Terminal output callback - called from the worker thread
+        def terminal_output(msg):
+            GLib.idle_add(self.terminal.feed, f"{msg}\r\n".encode())
+
+        def _auto_refresh_worker():
+            try:
+                # Use library function to refresh cache
+                ok = refresh_manifest_cache(manifest_url=DEFAULT_MANIFEST_URL, terminal_callback=terminal_output)
+                GLib.idle_add(self._finish_manual_refresh, ok, None)
+            except Exception as e:
+                GLib.idle_add(self._finish_manual_refresh, False, e)
+
+        self._manifest_refresh_thread = threading.Thread(target=_auto_refresh_worker, daemon=True)
+        self._manifest_refresh_thread.start()
+        return False
+
+    def _finish_manual_refresh(self, ok, error):
+        """Reload scripts on the main loop once a manual manifest refresh completes"""
         try:
-            # Terminal output callback
-            def terminal_output(msg):
-                self.terminal.feed(f"{msg}\r\n".encode())
-            
-            # Use library function to refresh cache
-            if refresh_manifest_cache(manifest_url=DEFAULT_MANIFEST_URL, terminal_callback=terminal_output):
+            if error is not None:
+                raise error
+            if ok:
                 # Reload scripts from fresh manifest
                 self.terminal.feed(b"\x1b[36m[*] Reloading scripts...\x1b[0m\r\n")
                 self._refresh_all_script_data()
+                self._last_manifest_sha = self._manifest_cache_digest()
                 self.terminal.feed(b"\x1b[32m[+] Manifest cache refreshed successfully\x1b[0m\r\n\r\n")
             else:
                 self.terminal.feed(b"\x1b[31m[!] Failed to refresh manifest cache\x1b[0m\r\n\r\n")
-            
+
         except Exception as e:
             self.terminal.feed(f"\x1b[31m[!] Error refreshing manifest: {e}\x1b[0m\r\n\r\n".encode())
-        
+
         # Return to prompt
         self.terminal.feed_child(b"\n")
         return False
 
-    def _show_about_dialog(self):
-        """Show about dialog with application information"""
+    def _build_about_markup(self):
+        """Build the Pango markup shown in the About dialog"""
         # Count scripts
         counts = {
             'install': len(SCRIPTS),
@@ -6978,9 +7326,28 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
                 markup_parts.append(style_map[style_type].format(content))
                 markup_parts.append("\n")
         
-        about_text = "".join(markup_parts)
-        
-        # Create dialog
+        return "".join(markup_parts)
+
+    def _show_about_dialog(self):
+        """Show about dialog with application information"""
+        # Markup only depends on the script counts, so reuse it until they change
+        cache_key = (len(SCRIPTS), len(TOOLS_SCRIPTS), len(EXERCISES_SCRIPTS), len(UNINSTALL_SCRIPTS))
+        if self._about_dialog is None:
+            self._build_about_dialog()
+        if cache_key != self._about_key:
+            about_text = self._about_markup_cache.get(cache_key)
+            if about_text is None:
+                about_text = self._build_about_markup()
+                self._about_markup_cache[cache_key] = about_text
+            # Re-parse the markup only when the counts have moved on
+            self._about_label.set_markup(about_text)
+            self._about_key = cache_key
+        self._about_dialog.present()
+
+    def _build_about_dialog(self):
+        """Create the About dialog once; closing it hides it for reuse"""
+        from gi.repository import Pango
+
         dialog = Gtk.Dialog(title="About LV Script Manager", transient_for=self, modal=True)
         dialog.set_default_size(700, 650)
         dialog.add_buttons(Gtk.STOCK_OK, Gtk.ResponseType.OK)
@@ -7000,19 +7367,18 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
         label.set_margin_top(12)
         label.set_margin_bottom(12)
         label.set_name("about-label")
-        label.set_markup(about_text)
-        label.connect("activate-link", self.on_link_clicked)
+        label.connect("activate-link", _open_link)
         
-        # Apply CSS for white text
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"#about-label { color: #ffffff; }")
-        label.get_style_context().add_provider(css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+        # Apply CSS for white text (provider is parsed once and shared)
+        label.get_style_context().add_provider(_about_css_provider(), Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
         
         scroll.add(label)
         dialog.get_content_area().pack_start(scroll, True, True, 0)
-        dialog.show_all()
-        dialog.run()
-        dialog.destroy()
+        dialog.connect("response", lambda d, _response: d.hide())
+        dialog.connect("delete-event", lambda d, _event: d.hide_on_delete())
+        scroll.show_all()
+        self._about_dialog = dialog
+        self._about_label = label
 
 
     def _refresh_ui_for_repo_setting(self):
@@ -7058,12 +7424,9 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
         if hasattr(self, 'refresh_item'):
             self.refresh_item.set_sensitive(self.repo_enabled)
         
-        # Refresh all tab contents to update cache status indicators
-        self._repopulate_tab_stores()
-        
-        # Force a complete UI refresh
-        while Gtk.events_pending():
-            Gtk.main_iteration()
+        # Refresh all tab contents on the next main-loop iteration so GTK can
+        # paint the notebook changes first (no nested event loop)
+        GLib.idle_add(self._repopulate_tab_stores)
 
     def _get_manifest_script_id(self, script_name, script_path):
         """Get script ID and manifest path from manifest for cache operations
@@ -7072,7 +7435,8 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
         Strips source tags like [Public Repository] or [Custom: name] from script name.
         
         Returns: tuple (script_id, manifest_path) or (None, None)
-                manifest_path is None for public repo, path string for custom manifests
+                manifest_path is None for public repo, path string for file-based
+                custom manifests, or the manifest dict for config-stored manifests
         """
         if not self.repository:
             return None, None
@@ -7130,92 +7494,43 @@ class ScriptMenuGTK(Gtk.ApplicationWindow):
                 pass
         
         # If source is custom or we haven't found it yet, search custom manifests
-        # FIRST: Check custom_manifests in config (these use temp files)
+        # FIRST: Check custom_manifests in config (manifest data lives in config.json)
         try:
-            config = self.repository.load_config()
-            custom_manifests_config = config.get('custom_manifests', {})
-            
-            for manifest_name, manifest_config in custom_manifests_config.items():
-                manifest_data = manifest_config.get('manifest_data')
-                if not manifest_data:
-                    continue
-                
-                scripts = manifest_data.get('scripts', {})
-                # Handle nested format
-                if isinstance(scripts, dict):
-                    all_scripts = []
-                    for category_scripts in scripts.values():
-                        all_scripts.extend(category_scripts)
-                    scripts = all_scripts
-                
-                for script in scripts:
-                    # Match by name (with source tag), id, or path
-                    script_display_name = f"{script.get('name', '')} [Local: {manifest_name}]"
-                    if (script.get('name') == clean_name or
-                        script_display_name == script_name or
-                        script.get('id') == pending_id):
-                        # Return with temp manifest path
-                        cache_dir = PathManager.get_config_dir() if PathManager else Path.home() / '.lv_linux_learn'
-                        temp_manifest_path = str(cache_dir / f"temp_{manifest_name}_manifest.json")
-                        # Ensure temp file exists
-                        with open(temp_manifest_path, 'w') as f:
-                            json.dump(manifest_data, f, indent=2)
-                        return script.get('id'), temp_manifest_path
+            config_manifests = _load_config_manifests_cached(self.repository)
+            
+            for manifest_name, index in config_manifests.items():
+                # Exact display-name match ("<name> [Local: <manifest>]") is a dict hit
+                script = index['by_display_name_local'].get(script_name)
+                if script is None:
+                    for candidate in index['scripts']:
+                        # Match by name or pending id
+                        if (candidate.get('name') == clean_name or
+                            (pending_id and candidate.get('id') == pending_id)):
+                            script = candidate
+                            break
+                if script is not None:
+                    # Hand the in-memory manifest straight to the cache engine
+                    return script.get('id'), index['manifest']
         except Exception as e:
             print(f"[DEBUG] Error searching config manifests: {e}")
             pass
         
         # THEN: Check filesystem-based custom manifests
         try:
-            custom_manifests_dir = PathManager.get_custom_manifests_dir() if PathManager else Path.home() / '.lv_linux_learn' / 'custom_manifests'
+            custom_manifests_dir = _custom_dir()
             if custom_manifests_dir.exists():
-                for manifest_file in custom_manifests_dir.glob('*/manifest.json'):
+                for manifest_file in _iter_custom_manifest_paths(custom_manifests_dir):
                     try:
-                        with open(manifest_file, 'r') as f:
-                            manifest = json.load(f)
-                            scripts = manifest.get('scripts', [])
-                            # Handle nested format
-                            if isinstance(scripts, dict):
-                                all_scripts = []
-                                for category_scripts in scripts.values():
-                                    all_scripts.extend(category_scripts)
-                                scripts = all_scripts
-                            
-                            for script in scripts:
-                                # Match by name or filename
-                                if (script.get('name') == clean_name or 
-                                    script.get('file_name') == script_filename):
-                                    # Return with manifest path for custom repo
-                                    return script.get('id'), str(manifest_file)
-                                # Also try matching by download_url for file:// custom manifests
-                                elif script.get('download_url', '').startswith('file://') and script_path in script.get('download_url', ''):
-                                    return script.get('id'), str(manifest_file)
-                    except Exception:
-                        continue
-                
-                # Also check direct JSON files in custom_manifests
-                for manifest_file in custom_manifests_dir.glob('*.json'):
-                    if manifest_file.name == 'manifest.json':
-                        continue  # Skip if it's a stray manifest.json in root
-                    try:
-                        with open(manifest_file, 'r') as f:
-                            manifest = json.load(f)
-                            scripts = manifest.get('scripts', [])
-                            # Handle nested format
-                            if isinstance(scripts, dict):
-                                all_scripts = []
-                                for category_scripts in scripts.values():
-                                    all_scripts.extend(category_scripts)
-                                scripts = all_scripts
-                            
-                            for script in scripts:
-                                # Match by name or filename
-                                if (script.get('name') == clean_name or 
-                                    script.get('file_name') == script_filename):
-                                    return script.get('id'), str(manifest_file)
-                                # Also try matching by download_url for file:// custom manifests
-                                elif script.get('download_url', '').startswith('file://') and script_path in script.get('download_url', ''):
-                                    return script.get('id'), str(manifest_file)
+                        scripts = _load_manifest_cached(manifest_file)['scripts']
+                        for script in scripts:
+                            # Match by name or filename
+                            if (script.get('name') == clean_name or 
+                                script.get('file_name') == script_filename):
+                                # Return with manifest path for custom repo
+                                return script.get('id'), manifest_file
+                            # Also try matching by download_url for file:// custom manifests
+                            elif script.get('download_url', '').startswith('file://') and script_path in script.get('download_url', ''):
+                                return script.get('id'), manifest_file
                     except Exception:
                         continue
         except Exception as e:
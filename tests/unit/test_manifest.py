@@ -7,7 +7,7 @@ import time
 import json
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, MagicMock, patch
 
 import pytest
 
@@ -76,3 +76,55 @@ def test_manifest_cache_respects_config_override(monkeypatch):
         assert mock_urlopen.called is True
         assert cache_path.read_text() == '{"scripts": []}'
         assert any(str(cache_path) == str(path) for path, _ in manifests)
+
+
+def test_refresh_manifest_cache_conditional_not_modified(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_dir = Path(tmpdir)
+        cache_file = config_dir / "manifest.json"
+        cache_file.write_text('{"scripts": ["cached"]}')
+        (config_dir / "manifest.etag").write_text(json.dumps({"etag": '"abc"', "last_modified": ""}))
+
+        monkeypatch.setattr(manifest_module.C, "CONFIG_DIR", config_dir)
+        monkeypatch.setattr(manifest_module.C, "MANIFEST_CACHE_FILE", cache_file)
+
+        not_modified = manifest_module.urllib.error.HTTPError(
+            "https://example.com/manifest.json", 304, "Not Modified", {}, None
+        )
+        with patch("lib.core.manifest.urlopen", side_effect=not_modified) as mock_urlopen:
+            result = manifest_module.refresh_manifest_cache(
+                manifest_url="https://example.com/manifest.json",
+                terminal_callback=lambda msg: None,
+                conditional=True
+            )
+
+        request = mock_urlopen.call_args[0][0]
+        assert result is True
+        assert request.get_header("If-none-match") == '"abc"'
+        assert cache_file.read_text() == '{"scripts": ["cached"]}'
+
+
+def test_refresh_manifest_cache_stores_etag(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_dir = Path(tmpdir)
+        cache_file = config_dir / "manifest.json"
+
+        monkeypatch.setattr(manifest_module.C, "CONFIG_DIR", config_dir)
+        monkeypatch.setattr(manifest_module.C, "MANIFEST_CACHE_FILE", cache_file)
+
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.read.return_value = b'{"scripts": []}'
+        mock_response.headers = {"ETag": '"v2"', "Last-Modified": "Sat, 17 Oct 2026 10:00:00 GMT"}
+
+        with patch("lib.core.manifest.urlopen", return_value=mock_response):
+            result = manifest_module.refresh_manifest_cache(
+                manifest_url="https://example.com/manifest.json",
+                terminal_callback=lambda msg: None,
+                conditional=True
+            )
+
+        assert result is True
+        assert cache_file.read_text() == '{"scripts": []}'
+        validators = json.loads((config_dir / "manifest.etag").read_text())
+        assert validators["etag"] == '"v2"'
@@ -607,6 +607,33 @@ class TestManifestParsing:
         scripts = repo.parse_manifest()
         
         assert scripts == []
+    
+    def test_get_script_by_id_accepts_manifest_dict(self, repo_with_temp_dirs):
+        """Should look up scripts in an in-memory manifest without a file"""
+        repo = repo_with_temp_dirs
+        
+        manifest = {
+            "scripts": {
+                "tools": [{"id": "custom_1", "file_name": "custom_1.sh"}]
+            }
+        }
+        
+        script = repo.get_script_by_id('custom_1', manifest_path=manifest)
+        
+        assert script is not None
+        assert script['category'] == 'tools'
+        assert repo.get_script_by_id('missing', manifest_path=manifest) is None
+    
+    def test_get_script_by_id_leaves_manifest_dict_untouched(self, repo_with_temp_dirs):
+        """Should not write the category into the caller's manifest data"""
+        repo = repo_with_temp_dirs
+        
+        entry = {"id": "custom_1", "file_name": "custom_1.sh"}
+        manifest = {"scripts": {"tools": [entry]}}
+        
+        repo.get_script_by_id('custom_1', manifest_path=manifest)
+        
+        assert 'category' not in entry
 
 
 class TestChecksumHandling:
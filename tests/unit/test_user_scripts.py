@@ -0,0 +1,86 @@
+"""
+Unit tests for CustomScriptManager lookups
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.utilities.user_scripts import CustomScriptManager
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """CustomScriptManager rooted in a temporary home directory"""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return CustomScriptManager()
+
+
+def test_get_script_by_path_finds_added_script(manager):
+    script_id, script_path = manager.add_script("Hello", "Says hello", "echo hello\n")
+
+    script = manager.get_script_by_path(str(script_path))
+
+    assert script is not None
+    assert script['id'] == script_id
+
+
+def test_get_script_by_path_sees_later_changes(manager):
+    _, first_path = manager.add_script("First", "", "true\n")
+    assert manager.get_script_by_path(str(first_path)) is not None
+
+    _, second_path = manager.add_script("Second with a longer name", "", "true\n")
+
+    assert manager.get_script_by_path(str(second_path))['name'] == "Second with a longer name"
+    assert manager.get_script_by_path("/nonexistent.sh") is None
+
+
+def test_list_scripts_reparses_only_after_file_changes(manager, monkeypatch):
+    real_load = json.load
+    manager.add_script("Cached", "", "true\n")
+    first = manager.list_scripts()
+
+    def fail_load(*args, **kwargs):
+        raise AssertionError("config re-parsed although the file did not change")
+
+    monkeypatch.setattr(json, "load", fail_load)
+    assert manager.list_scripts() is first
+
+    monkeypatch.setattr(json, "load", real_load)
+    manager.config_file.write_text('{"scripts": [{"id": "x", "name": "External edit"}]}')
+    assert [s['name'] for s in manager.list_scripts()] == ["External edit"]
+
+
+def test_save_config_replaces_file_without_leaving_temp(manager):
+    manager.add_script("Atomic", "", "true\n")
+
+    assert json.loads(manager.config_file.read_text())['scripts'][0]['name'] == "Atomic"
+    assert not manager.config_file.with_suffix('.tmp').exists()
+
+
+def test_get_script_by_id_tracks_update_and_remove(manager):
+    script_id, script_path = manager.add_script("Original", "", "true\n")
+
+    assert manager.update_script(script_id, name="Renamed") is True
+    assert manager.get_script_by_id(script_id)['name'] == "Renamed"
+    assert manager.update_script("missing-id", name="Nope") is False
+
+    assert manager.remove_script(script_id) is True
+    assert manager.get_script_by_id(script_id) is None
+    assert not script_path.exists()
+
+
+def test_update_script_persists_without_file_stamp(manager, monkeypatch):
+    script_id, _ = manager.add_script("Before", "", "true\n")
+    monkeypatch.setattr(manager, "_file_stamp", lambda: None)
+
+    assert manager.update_script(script_id, name="After") is True
+
+    saved = json.loads(manager.config_file.read_text())['scripts']
+    assert [s['name'] for s in saved] == ["After"]
+    assert manager.remove_script(script_id) is True